@@ -67,15 +67,17 @@ class Datatype(Enum):
         Returns:
             Datatype -- type of value or `NONE`.
         """
-        for enum in Datatype:
-            if(enum is Datatype.TIMESTAMP):
-                continue
+        for enum in _AUTO_DATATYPES:
             if(isinstance(value, enum.value)):
                 return enum
 
         ExceptionUtils.error_message(f"No auto type found for {value}")
         return Datatype.NONE
 
+_AUTO_DATATYPES: Tuple[Datatype, ...] = tuple(
+    datatype for datatype in Datatype if datatype is not Datatype.TIMESTAMP)
+"""Datatypes checked by `get_auto_datatype` in declaration order, iterated once instead of on each call."""
+
 class RetentionPolicy:
     """Represents a influxdb retention policy.
 
@@ -156,6 +158,9 @@ class RetentionPolicy:
             ExceptionUtils.exception_info(error)
             raise ValueError(f"shard duration for retention policy {name} is not in the correct time format")
 
+        # all values are read-only, compute the hash only once
+        self.__hash: int = hash(json.dumps(self.to_dict(), sort_keys=True))
+
     def to_dict(self) -> Dict[str, Union[str, int, bool]]:
         """Used to create a dict out of the values, able to compare to influxdb-created dict"""
         return {
@@ -173,12 +178,15 @@ class RetentionPolicy:
         return f"Retention Policy: {self.name}"
 
     def __eq__(self, o: object) -> bool:
+        if(o is self):
+            return True
         if(isinstance(o, RetentionPolicy)):
-            return o.to_dict() == self.to_dict()
+            # different hash: cannot be equal, saves creating both dicts
+            return hash(o) == self.__hash and o.to_dict() == self.to_dict()
         return False
 
     def __hash__(self) -> int:
-        return hash(json.dumps(self.to_dict(), sort_keys=True))
+        return self.__hash
 
 class Table:
     """Represents a measurement in influx. Contains pre-defined tag and field definitions.
@@ -249,6 +257,10 @@ class Table:
         self.__time_key: str = time_key
         self.__retention_policy = retention_policy
 
+        # resolved once per table, each split copies those instead of rebuilding them
+        self.__empty_fields: Dict[str, Any] = dict.fromkeys(fields, None)
+        self.__empty_tags: Dict[str, Any] = dict.fromkeys(tags, None)
+
         # escape not allowed characters in Measurement
         for bad_character in self.__bad_measurement_characters:
             if(re.search(bad_character, name)):
@@ -285,22 +297,24 @@ class Table:
             raise ValueError("need at least one value in dict to split")
 
         # if table is not defined use default split
-        if(not self.fields):
+        if(not self.__fields):
             return InfluxUtils.default_split(mydict=mydict)
 
         # fill dicts
-        # table.fields is a dict, we only need the keys
-        fields: Dict[str, Any] = dict.fromkeys(self.fields.keys(), None)
-        tags: Dict[str, Any] = dict.fromkeys(self.tags, None)
+        # copies of the per-table templates, table.fields is a dict, we only need the keys
+        fields: Dict[str, Any] = self.__empty_fields.copy()
+        tags: Dict[str, Any] = self.__empty_tags.copy()
 
         # what field should be recorded as time
-        time_stamp_field = self.time_key
+        time_stamp_field = self.__time_key
         # helper variable to only overwrite if it is not the time_stamp_field
         time_overwrite_allowed = True
         # actualy timestamp saved
         time_stamp: Union[str, int, None] = None
 
-
+        # looked up once instead of for each key
+        time_key_names = InfluxUtils.time_key_names
+        capture_time_key = SppUtils.capture_time_key
 
         for (key, value) in mydict.items():
 
@@ -309,10 +323,10 @@ class Table:
                 continue
 
             # Check timestamp value if it matches any of predefined time names
-            if(key in time_stamp_field or key in InfluxUtils.time_key_names):
+            if(key in time_stamp_field or key in time_key_names):
 
                 # sppmonCTS has lowest priority, only set if otherwise None
-                if(time_stamp is None and key == SppUtils.capture_time_key):
+                if(time_stamp is None and key == capture_time_key):
                     time_stamp = value
 
                 # time_stamp_field is highest priority. Do not overwrite it.
@@ -333,7 +347,7 @@ class Table:
                 fields[key] = value
             elif(key in tags):
                 tags[key] = value
-            elif(key in InfluxUtils.time_key_names or key in time_stamp_field):
+            elif(key in time_key_names or key in time_stamp_field):
                 continue
             else:
                 ExceptionUtils.error_message(f"Not all columns for table {self.name} are declared: {key}")
@@ -385,7 +399,11 @@ class Database:
         Returns:
             Table -- Instance of a predefined table, otherwise new empty table
         """
-        return self.tables.get(table_name, Table(self, table_name))
+        table = self.tables.get(table_name, None)
+        # only create the empty table if required, called for each insert
+        if(table is None):
+            table = Table(self, table_name)
+        return table
 
     def __str__(self) -> str:
         return self.name
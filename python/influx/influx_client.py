@@ -6,7 +6,8 @@ Classes:
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import requests
 from influxdb import InfluxDBClient
@@ -37,6 +38,7 @@ class InfluxClient:
         check_create_cq - Checks if any continuous query needs to be altered or added
         insert_dicts_to_buffer - Method to insert data into influxb
         flush_insert_buffer - flushes buffer, send querys to influxdb
+        wait_for_pending_send - blocks until the last flushed buffer is sent
         send_selection_query - sends a single `SelectionQuery` to influxdb
         copy_database - copies whole database into a new one
 
@@ -60,12 +62,12 @@ class InfluxClient:
         """Database with predef tables. Access by [tablename] to gain instance"""
         return self.__database
 
-    __insert_buffer: Dict[Table, List[InsertQuery]] = {}
-    """used to send all insert-querys at once. Multiple Insert-Querys per table"""
-
     __query_max_batch_size = 10000
     """Maximum amount of querys sent at once to the influxdb. Recommended is 5000-10000."""
 
+    __default_flush_max_seconds = 10.0
+    """Default maximum time in seconds inserts are kept within the buffer before they are sent."""
+
     def __init__(self, config_file: Dict[str, Any]):
         """Initalize the influx client from a config dict. Call `connect` before using the client.
 
@@ -78,6 +80,13 @@ class InfluxClient:
         if(not config_file):
             raise ValueError("A config file is required to setup the InfluxDB client.")
 
+        self.__insert_buffer: Dict[Table, List[str]] = {}
+        """used to send all insert-querys at once. Multiple Insert-Querys per table, already computed into line protocol"""
+        self.__buffered_count: int = 0
+        """count of insert-querys within the buffer over all tables"""
+        self.__buffer_start: float = time.perf_counter()
+        """time the oldest insert-query was added to the buffer, used to limit the time inserts wait within the buffer"""
+
         auth_influx = SppUtils.get_cfg_params(param_dict=config_file, param_name="influxDB")
         if(not isinstance(auth_influx, dict)):
             raise ValueError("The InfluxDB config is corrupted within the file: Needs to be a dictionary.")
@@ -94,6 +103,11 @@ class InfluxClient:
             self.__address: str = auth_influx["srv_address"]
             self.__database: Database = Database(auth_influx["dbName"])
 
+            # optional, trade memory and request count against the delay until data is sent
+            self.__flush_size: int = auth_influx.get("insert_flush_size", self.__query_max_batch_size)
+            self.__flush_max_seconds: float = auth_influx.get(
+                "insert_flush_seconds", self.__default_flush_max_seconds)
+
             # Create table definitions in code
             Definitions.add_table_definitions(self.database)
 
@@ -103,10 +117,22 @@ class InfluxClient:
             raise ValueError(
                 "Missing Influx-Config arg", str(key_error))
 
+        if(not isinstance(self.__flush_size, int) or self.__flush_size < 1):
+            raise ValueError("insert_flush_size of the InfluxDB config needs to be a positive integer",
+                             self.__flush_size)
+        if(not isinstance(self.__flush_max_seconds, (int, float)) or self.__flush_max_seconds <= 0):
+            raise ValueError("insert_flush_seconds of the InfluxDB config needs to be a positive number",
+                             self.__flush_max_seconds)
+
         # declare for later
         self.__client: InfluxDBClient
         self.__version: str
 
+        # single thread to keep the order of inserts
+        self.__send_executor = ThreadPoolExecutor(max_workers=1)
+        self.__pending_send: Optional[Future] = None
+        """send of the last flushed buffer, None if nothing is on the way"""
+
     def connect(self) -> None:
         """Connect client to remote server. Call this before using any other methods.
 
@@ -126,7 +152,7 @@ class InfluxClient:
 
             # ping to make sure connection works
             self.__version: str = self.__client.ping()
-            LOGGER.debug(f"Connected to influxdb, version: {self.__version}")
+            LOGGER.debug("Connected to influxdb, version: %s", self.__version)
 
             # create db, nothing happens if it already exists
             self.__client.create_database(self.database.name)
@@ -146,7 +172,7 @@ class InfluxClient:
         # Double send to make sure all metrics are send
         try:
             self.flush_insert_buffer()
-            self.flush_insert_buffer()
+            self.flush_insert_buffer(wait=True)
         except ValueError as error:
             ExceptionUtils.exception_info(
                 error=error,
@@ -185,7 +211,7 @@ class InfluxClient:
                 elif(result_rp != retention_policy.to_dict()):
                     alter_rp_list.append(retention_policy)
                 # else: all good
-            LOGGER.debug(f"missing {len(add_rp_list)} RP's. Adding {add_rp_list}")
+            LOGGER.debug("missing %d RP's. Adding %s", len(add_rp_list), add_rp_list)
             for retention_policy in add_rp_list:
                 self.__client.create_retention_policy( # type: ignore
                     name=retention_policy.name,
@@ -195,7 +221,7 @@ class InfluxClient:
                     default=retention_policy.default,
                     shard_duration=retention_policy.shard_duration
                 )
-            LOGGER.debug(f"altering {len(add_rp_list)} RP's. altering {add_rp_list}")
+            LOGGER.debug("altering %d RP's. altering %s", len(add_rp_list), add_rp_list)
             for retention_policy in alter_rp_list:
                 self.__client.alter_retention_policy( # type: ignore
                     name=retention_policy.name,
@@ -244,7 +270,7 @@ class InfluxClient:
                     alter_cq_list.append(continuous_query)
                 # else: all good
 
-            LOGGER.debug(f"altering {len(add_cq_list)} CQ's. deleting {add_cq_list}")
+            LOGGER.debug("altering %d CQ's. deleting %s", len(add_cq_list), add_cq_list)
             # alter not possible -> drop and readd
             for continuous_query in alter_cq_list:
                 self.__client.drop_continuous_query(  # type: ignore
@@ -253,7 +279,7 @@ class InfluxClient:
                 )
             # extend to reinsert
             add_cq_list.extend(alter_cq_list)
-            LOGGER.debug(f"adding {len(add_cq_list)} CQ's. adding {add_cq_list}")
+            LOGGER.debug("adding %d CQ's. adding %s", len(add_cq_list), add_cq_list)
             for continuous_query in add_cq_list:
                 self.__client.create_continuous_query( # type: ignore
                     name=continuous_query.name,
@@ -350,7 +376,8 @@ class InfluxClient:
         # line count since last print
         line_collection: int = 0
 
-        # disable timeout
+        # disable timeout, the client is replaced so nothing may be sent meanwhile
+        self.wait_for_pending_send()
         old_timeout = self.__client._timeout
         self.__client = InfluxDBClient( # type: ignore
             host=self.__address,
@@ -435,28 +462,29 @@ class InfluxClient:
 
 
 
-    def insert_dicts_to_buffer(self, table_name: str, list_with_dicts: List[Dict[str, Any]]) -> None:
+    def insert_dicts_to_buffer(self, table_name: str, list_with_dicts: Iterable[Dict[str, Any]]) -> None:
         """Insert a list of dicts with data into influxdb. Splits according to table definition.
 
         It is highly recommened to define a table before in database_table.py. If not present, splits by type analysis.
+        Any iterable is accepted: each dict is formatted when it is consumed, a generator is never copied into a list.
         Important: Querys are only buffered, not sent. Call flush_insert_buffer to flush.
 
         Arguments:
             table_name {str} -- Name of the table to be inserted
-            list_with_dicts {List[Dict[str, Any]]} -- List with dicts whith collum name as key.
+            list_with_dicts {Iterable[Dict[str, Any]]} -- List or other iterable with dicts whith collum name as key.
 
         Raises:
             ValueError: No list with dictonarys are given or of wrong type.
             ValueError: No table name is given
         """
-        LOGGER.debug(f"Enter insert_dicts for table: {table_name}")
+        LOGGER.debug("Enter insert_dicts for table: %s", table_name)
         if(list_with_dicts is None): # empty list is allowed
             raise ValueError("missing list with dictonarys in insert")
         if(not table_name):
             raise ValueError("table name needs to be set in insert")
 
         # Only insert of something is there to insert
-        if(not list_with_dicts):
+        if(isinstance(list_with_dicts, list) and not list_with_dicts):
             LOGGER.debug("nothing to insert for table %s due empty list", table_name)
             return
 
@@ -464,61 +492,120 @@ class InfluxClient:
         table = self.database[table_name]
 
         # Generate querys for each dict
-        query_buffer = []
+        query_buffer: List[str] = []
+        # bound once instead of looked up for each dict
+        split_by_table_def = table.split_by_table_def
+        append_query = query_buffer.append
         for mydict in list_with_dicts:
             try:
                 # split dict according to default tables
-                (tags, values, timestamp) = table.split_by_table_def(mydict=mydict)
+                (tags, values, timestamp) = split_by_table_def(mydict=mydict)
 
                 if(isinstance(timestamp, str)):
                     timestamp = int(timestamp)
                 # LOGGER.debug("%d %s %s %d",appendCount,tags,values,timestamp)
 
-                # create query and append to query_buffer
-                query_buffer.append(InsertQuery(table, values, tags, timestamp))
+                # create query and append it as line protocol to query_buffer
+                append_query(InsertQuery(table, values, tags, timestamp).to_query())
             except ValueError as err:
                 ExceptionUtils.exception_info(error=err, extra_message="skipping single dict to insert")
                 continue
 
+        # an empty iterable is only known after consuming it
+        if(not query_buffer):
+            LOGGER.debug("nothing to insert for table %s due empty list", table_name)
+            return
+
+        if(not self.__buffered_count):
+            self.__buffer_start = time.perf_counter()
         # extend existing inserts by new one and add to insert_buffer
-        table_buffer = self.__insert_buffer.get(table, list())
-        table_buffer.extend(query_buffer)
-        self.__insert_buffer[table] = table_buffer
+        self.__insert_buffer.setdefault(table, []).extend(query_buffer)
+        self.__buffered_count += len(query_buffer)
         LOGGER.debug("Appended %d items to the insert buffer", len(query_buffer))
 
-        # safeguard to avoid memoryError
-        if(len(self.__insert_buffer[table]) > 5 * self.__query_max_batch_size):
+        # send as soon as a full batch is available or the oldest inserts waited too long:
+        # the send happens in background while the next data is collected. Also a safeguard to avoid memoryError
+        if(self.__buffered_count >= self.__flush_size
+           or time.perf_counter() - self.__buffer_start > self.__flush_max_seconds):
             self.flush_insert_buffer()
 
-        LOGGER.debug(f"Exit insert_dicts for table: {table_name}")
+        LOGGER.debug("Exit insert_dicts for table: %s", table_name)
 
-    def flush_insert_buffer(self) -> None:
+    def flush_insert_buffer(self, wait: bool = False) -> None:
         """Flushes the insert buffer, send querys to influxdb server.
 
         Sends in batches defined by `__batch_size` to reduce http overhead.
+        Tables sharing a retention policy are sent within the same batches.
+        The send happens in background, unless `wait` is set or `wait_for_pending_send` is called.
         Only send-statistics remain in buffer, flush again to send those too.
 
+        Keyword Arguments:
+            wait {bool} -- block until the send is finished, so its errors are reported (default: {False})
+
         Raises:
             ValueError: Critical: The query Buffer is None.
         """
 
         if(self.__insert_buffer is None):
             raise ValueError("query buffer is somehow None, this should never happen!")
+
+        # only one send at a time to keep the order of inserts
+        self.wait_for_pending_send()
+
         # Only send if there is something to send
         if(not self.__insert_buffer):
             return
 
         # Done before to be able to clear buffer before sending
-        # therefore stats can be re-inserted
-        insert_list: List[Tuple[Table, List[str]]] = []
+        # therefore stats can be re-inserted. Queries are already in line protocol.
+        # All tables of one retention policy are sent together, the RP is the only per-request parameter.
+        # Key is the name of the RP, value is a tuple of the item count per table and all queries.
+        insert_dict: Dict[str, Tuple[Dict[Table, int], List[str]]] = {}
         for(table, queries) in self.__insert_buffer.items():
-
-            insert_list.append((table, list(map(lambda query: query.to_query(), queries))))
+            (tables_count, queries_str) = insert_dict.setdefault(table.retention_policy.name, ({}, []))
+            tables_count[table] = len(queries)
+            queries_str.extend(queries)
 
         # clear all querys which are now transformed
         self.__insert_buffer.clear()
+        self.__buffered_count = 0
+
+        # send in background, the caller continues to collect data meanwhile
+        self.__pending_send = self.__send_executor.submit(self.__send_insert_dict, insert_dict)
 
-        for(table, queries_str) in insert_list:
+        if(wait):
+            self.wait_for_pending_send()
+
+    def wait_for_pending_send(self) -> None:
+        """Blocks until the last flushed buffer is sent, adding its send-statistics to the buffer.
+
+        Called automatically before each flush and selection query to keep the order of all queries.
+        """
+        if(self.__pending_send is None):
+            return
+        pending_send = self.__pending_send
+        self.__pending_send = None
+        # the send method catches all expected errors itself, others are raised here
+        send_metrics = pending_send.result()
+
+        for (tables_count, duration_s, batch_size) in send_metrics:
+            # add metrics for the next sending process.
+            self.__insert_metrics_to_buffer(Keyword.INSERT, tables_count, duration_s, batch_size)
+
+    def __send_insert_dict(self, insert_dict: Dict[str, Tuple[Dict[Table, int], List[str]]]
+                           ) -> List[Tuple[Dict[Table, int], float, int]]:
+        """Sends the computed insert queries per retention policy. Executed within the send thread.
+
+        Does not touch the insert buffer, the statistics are returned instead.
+
+        Arguments:
+            insert_dict {Dict[str, Tuple[Dict[Table, int], List[str]]]} -- RP-name as key, item count per table and queries as value
+
+        Returns:
+            List[Tuple[Dict[Table, int], float, int]] -- per send: item count per table, duration in s and batch size
+        """
+        send_metrics: List[Tuple[Dict[Table, int], float, int]] = []
+        for(retention_policy_name, (tables_count, queries_str)) in insert_dict.items():
 
             # stop time for send progess
             start_time = time.perf_counter()
@@ -526,7 +613,7 @@ class InfluxClient:
                 # send batch_size querys at once
                 self.__client.write_points(
                     points=queries_str, database=self.database.name,
-                    retention_policy=table.retention_policy.name,
+                    retention_policy=retention_policy_name,
                     batch_size=self.__query_max_batch_size,
                     time_precision='s', protocol='line')
             except InfluxDBClientError as error: # type: ignore
@@ -540,10 +627,10 @@ class InfluxClient:
                 ExceptionUtils.exception_info(error=error, extra_message="Error when sending Insert Buffer") # type: ignore
             end_time = time.perf_counter()
 
-            # add metrics for the next sending process.
-            # compute duration, metrics computed per batch
-            self.__insert_metrics_to_buffer(
-                Keyword.INSERT, {table:len(queries_str)}, end_time-start_time, len(queries_str))
+            # compute duration, metrics computed per batch and split by table
+            send_metrics.append((tables_count, end_time-start_time, len(queries_str)))
+
+        return send_metrics
 
     def __insert_metrics_to_buffer(self, keyword: Keyword, tables_count: Dict[Table, int],
                                    duration_s: float, batch_size: int = 1) -> None:
@@ -573,6 +660,9 @@ class InfluxClient:
             raise ValueError("only positive values are supported for batch_size. Must be not 0")
 
         # get shared record time to be saved on
+        time_stamp = SppUtils.get_actual_time_sec()
+        # same for all tables, only scaled by the item count of each table
+        duration_ms_per_item = duration_s * 1000 / batch_size
         querys = []
 
         # save metrics for each involved table individually
@@ -582,16 +672,16 @@ class InfluxClient:
                     table=self.__metrics_table,
                     fields={
                         # Calculating relative duration for this part of whole query
-                        'duration_ms':  duration_s*1000*(max(item_count, 1)/batch_size),
+                        'duration_ms':  duration_ms_per_item * max(item_count, 1),
                         'item_count':   item_count,
                     },
                     tags={
                         'keyword':      keyword,
                         'tableName':    table.name,
                     },
-                    time_stamp=SppUtils.get_actual_time_sec()
-                ))
-        self.__insert_buffer[self.__metrics_table] = self.__insert_buffer.get(self.__metrics_table, []) + querys
+                    time_stamp=time_stamp
+                ).to_query())
+        self.__insert_buffer.setdefault(self.__metrics_table, []).extend(querys)
 
     def update_row(self, table_name: str, tag_dic: Dict[str, str] = None,
                    field_dic: Dict[str, Union[str, int, float, bool]] = None, where_str: str = None):
@@ -676,9 +766,12 @@ class InfluxClient:
             if(table in self.__insert_buffer):
                 self.flush_insert_buffer()
                 break
+        # make sure no data is still on the way
+        self.wait_for_pending_send()
 
-        # Convert querys to strings
+        # Convert querys to strings, only once for both logging and sending
         query_str = query.to_query()
+        LOGGER.debug("sending selection query: %s", query_str)
 
         start_time = time.perf_counter()
         # Send querys
@@ -9,6 +9,7 @@ Classes:
 """
 from __future__ import annotations
 from enum import Enum, unique
+from functools import lru_cache
 import re
 
 from typing import List, Dict, Any, Union, Tuple, Optional
@@ -42,10 +43,29 @@ class InsertQuery:
         format_fields - Formats fields accordingly to the requirements of the influxdb.
         format_tags - Formats tags accordingly to the requirements of the influxdb.
     """
+    __slots__ = ("__keyword", "__table", "__time_stamp", "__fields", "__tags")
+    """created once for each inserted row, no instance dict required"""
+
     # those need to be escaped
     __bad_name_characters: List[Tuple[str, str]] = [(r'=', r'\='), (r' ', r'\ '), (r',', r'\,')]
     """Characters which need to be replaced, as tuple list: (old, new). Reference influx wiki."""
 
+    __bad_string_characters: List[Tuple[str, str]] = [(r'"', r'\"')]
+    """Characters which need to be replaced within string field values, as tuple list: (old, new)."""
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def __escape_name(name: str) -> str:
+        """Escapes a field or tag name. Only few distinct names exist, so the result is cached.
+
+        Arguments:
+            name {str} -- field or tag name to be escaped
+
+        Returns:
+            str -- escaped name
+        """
+        return InfluxUtils.escape_chars(value=name, replace_list=InsertQuery.__bad_name_characters)
+
     @property
     def keyword(self) -> Keyword:
         """Always `Keyword.INSERT`"""
@@ -75,7 +95,7 @@ class InsertQuery:
         fields = self.format_fields(fields)
 
         # make sure you have some fields if they are not privided
-        if(not list(filter(lambda field_tup: field_tup[1] is not None, fields.items()))):
+        if(not any(value is not None for value in fields.values())):
             # need default def to be able to do anything
             if(not table.fields):
                 raise ValueError("fields after formatting empty, need at least one value!")
@@ -85,7 +105,7 @@ class InsertQuery:
                     fields[key] = '\"autofilled\"'
                     break
             # test again, improvement possible here
-            if(not list(filter(lambda field_tup: field_tup[1] is not None, fields.items()))):
+            if(not any(value is not None for value in fields.values())):
                 raise ValueError("fields after formatting empty, need at least one value!")
 
         self.__fields: Dict[str, Union[int, float, str, bool]] = fields
@@ -104,15 +124,11 @@ class InsertQuery:
             str -- a full functional insert query as string
         """
         if(self.__tags):
-            tag_str = ',{}'.format(
-                ",".join(map(lambda row: '{key}={value}'.format(key=row[0], value=row[1]),
-                             self.__tags.items())))
+            tag_str = ',' + ','.join(f'{key}={value}' for (key, value) in self.__tags.items())
         else:
             tag_str = ''
 
-        fields_str = ",".join(
-            map(lambda row: '{key}={value}'.format(key=row[0], value=row[1]),
-                self.__fields.items()))
+        fields_str = ','.join(f'{key}={value}' for (key, value) in self.__fields.items())
 
         if(self.__time_stamp is not None):
             time_stamp_str = str(self.__time_stamp)
@@ -135,23 +151,25 @@ class InsertQuery:
             Dict[str, Union[int, float, str]] -- Dict with field name as key and data as value
         """
         ret_dict: Dict[str, Union[int, float, str]] = {}
+        # resolved once for all fields instead of via the table properties for each key
+        field_datatypes = self.table.fields
         for(key, value) in fields.items():
             if(value is None or (isinstance(value, str) and not value)):
                 continue
 
             # Get Colum Datatype
-            datatype = self.table.fields.get(key, None)
+            datatype = field_datatypes.get(key, None)
             # If nothing is defined select it automatic
             if(datatype is None):
                 datatype = Structures.Datatype.get_auto_datatype(value)
 
             # Escape not allowed chars in Key
-            key = InfluxUtils.escape_chars(value=key, replace_list=self.__bad_name_characters)
+            key = self.__escape_name(key)
 
 
             # Format Strings
             if(datatype == Structures.Datatype.STRING):
-                value = InfluxUtils.escape_chars(value=value, replace_list=[(r'"', r'\"')])
+                value = InfluxUtils.escape_chars(value=value, replace_list=self.__bad_string_characters)
                 value = "\"{}\"".format(value)
 
             # Make time always be saved in seconds, save as int
@@ -186,7 +204,7 @@ class InsertQuery:
             if(not isinstance(value, str)):
                 value = f"{value}"
             # escape not allowed characters
-            key = InfluxUtils.escape_chars(value=key, replace_list=self.__bad_name_characters)
+            key = self.__escape_name(key)
             value = InfluxUtils.escape_chars(value=value, replace_list=self.__bad_name_characters)
 
             ret_dict[key] = value
@@ -439,6 +457,9 @@ class ContinuousQuery:
         else:
             self.__resample_opts = None
 
+        # all values are read-only, compute the hash only once
+        self.__hash: int = hash(self.to_query())
+
     def __str__(self) -> str:
         return self.to_query()
 
@@ -446,12 +467,15 @@ class ContinuousQuery:
         return f"Continuous Query: {self.to_query()}"
 
     def __eq__(self, o: object) -> bool:
+        if(o is self):
+            return True
         if(isinstance(o, ContinuousQuery)):
-            return o.to_query() == self.to_query()
+            # different hash: cannot be equal, saves computing both queries
+            return hash(o) == self.__hash and o.to_query() == self.to_query()
         return False
 
     def __hash__(self) -> int:
-        return hash(self.to_query())
+        return self.__hash
 
     def to_query(self) -> str:
         """computes query into a string
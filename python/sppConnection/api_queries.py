@@ -4,7 +4,7 @@ Classes:
     ApiQueries
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 import json
 import urllib.parse
 
@@ -21,6 +21,7 @@ class ApiQueries:
     """Wrapper class to contain snippets of api-calls. You may add new snippets here.
 
     All methods may return the type `List[Dict[str, Any]]` due the rest-api call.
+    `get_all_vms` yields those lists page by page due to the amount of vm's.
 
     Methods:
         get_sites
@@ -34,8 +35,21 @@ class ApiQueries:
         get_job_log_details
         get_server_metrics
         get_file_system
+
+    Attributes:
+        max_concurrent_requests - maximum of api-calls which may be sent concurrently.
     """
 
+    __job_log_filter_template: str = \
+        '[{{"property":"jobsessionId","value":{jobsession_id},"op":"="}},' \
+        '{{"property":"type","value":{job_logs_type},"op":"IN"}}]'
+    """filter of the joblog request, only the session id and log types are filled in per request"""
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """maximum of api-calls which may be sent concurrently, limited by the REST client"""
+        return self.__rest_client.max_concurrent_requests
+
     def __init__(self, rest_client: RestClient):
         if(not rest_client):
             raise ValueError("no REST connection defined for queries")
@@ -84,8 +98,8 @@ class ApiQueries:
         object_list = self.__rest_client.get_objects(endpoint=endpoint, array_name=array_name, white_list=white_list)
         return object_list
 
-    def get_all_vms(self) -> List[Dict[str, Any]]:
-        """retrieves a list of all vm's with their statistics."""
+    def get_all_vms(self) -> Iterator[List[Dict[str, Any]]]:
+        """retrieves all vm's with their statistics, yielding them page by page."""
         endpoint = "/api/endeavour/catalog/hypervisor/vm"
         white_list = [
             "id", "properties.name", "properties.host", "catalogTime",
@@ -100,7 +114,7 @@ class ApiQueries:
         array_name = "children"
 
         endpoint = ConnectionUtils.url_set_param(url=endpoint, param_name="embed", param_value="(children(properties))")
-        return self.__rest_client.get_objects(
+        return self.__rest_client.get_object_pages(
             endpoint=endpoint,
             array_name=array_name,
             white_list=white_list,
@@ -121,7 +135,9 @@ class ApiQueries:
             add_time_stamp=False
         )
 
-        result_list: List[Dict[str, Any]] = []
+        # first collect all queries, then send them at once
+        sla_info_list: List[Tuple[str, Optional[str]]] = []
+        query_list: List[Tuple[str, str]] = []
         for sla_policty in sla_policty_list:
             try:
                 sla_name: str = sla_policty["name"]
@@ -130,8 +146,6 @@ class ApiQueries:
                 continue
             sla_id: Optional[str] = sla_policty.get("id", None)
 
-            result_dict: Dict[str, Any] = {}
-
             ## hotadd:
             sla_name = urllib.parse.quote_plus(sla_name)
 
@@ -145,13 +159,21 @@ class ApiQueries:
             # need to check if hypervisortype must be specified
             post_data = json.dumps({"name": "*", "hypervisorType": "vmware"})
 
-            response_json = self.__rest_client.post_data(endpoint=endpoint, post_data=post_data)
+            sla_info_list.append((sla_name, sla_id))
+            query_list.append((endpoint, post_data))
+
+        response_list = self.__rest_client.post_data_list(query_list=query_list)
+
+        # all slas are queried at once, share a single timestamp
+        time_key, time = SppUtils.get_capture_timestamp_sec()
+
+        result_list: List[Dict[str, Any]] = []
+        for ((sla_name, sla_id), response_json) in zip(sla_info_list, response_list):
+            result_dict: Dict[str, Any] = {}
 
             result_dict["slaName"] = sla_name
             result_dict["slaId"] = sla_id
             result_dict["vmCountBySLA"] = response_json.get("total")
-
-            time_key, time = SppUtils.get_capture_timestamp_sec()
             result_dict[time_key] = time
 
             result_list.append(result_dict)
@@ -242,8 +264,8 @@ class ApiQueries:
             "message", "messageParams", "type"]
         array_name = "logs"
 
-        api_filter = '[{"property":"jobsessionId","value":' + str(jobsession_id) + ',"op":"="},' \
-                    '{"property":"type","value":'+ job_logs_type +',"op":"IN"}]'
+        api_filter = self.__job_log_filter_template.format(
+            jobsession_id=jobsession_id, job_logs_type=job_logs_type)
 
         #update the filter parameter to list all types if message types, not only info..
         endpoint_to_logs = ConnectionUtils.url_set_param(url=endpoint, param_name="filter", param_value=api_filter)
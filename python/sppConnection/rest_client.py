@@ -2,17 +2,29 @@
 
 Classes:
     RestClient
+    KeepAliveAdapter
 """
 from __future__ import annotations
 import logging
 import json
-from typing import Optional, Tuple, Dict, List, Any
+import socket
+from typing import Iterator, Optional, Tuple, Dict, List, Any
 
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from requests.models import Response
 from requests.auth import HTTPBasicAuth
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    # optional, parses large responses multiple times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
 
 from utils.connection_utils import ConnectionUtils
 from utils.execption_utils import ExceptionUtils
@@ -24,6 +36,25 @@ LOGGER = logging.getLogger("sppmon")
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter which enables TCP keep-alive on all pooled connections.
+
+    Prevents firewalls from silently dropping the idle connection between two requests.
+    The idle/interval/count options are only set if the platform supports them (Linux).
+    """
+
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+        (socket.IPPROTO_TCP, getattr(socket, option_name), option_value)
+        for (option_name, option_value) in [("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 20), ("TCP_KEEPCNT", 3)]
+        if hasattr(socket, option_name)]
+    """socket options for each new connection"""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Creates the pool manager, adding the keep-alive socket options."""
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RestClient():
     """Provides access to the REST-API. You need to login before using it.
 
@@ -32,7 +63,12 @@ class RestClient():
         logout - Logs out of the REST-API.
         get_spp_version_build - queries the spp version and build number.
         get_objects - Querys a response(-list) from a REST-API endpoint or URI.
+        get_object_pages - Querys a response(-list) from a REST-API endpoint or URI page by page.
         post_data - Queries endpoint by a POST-Request.
+        post_data_list - Queries multiple endpoints by concurrent POST-Requests.
+
+    Attributes:
+        max_concurrent_requests - maximum of requests sent concurrently to the SPP-Server.
 
     """
 
@@ -42,6 +78,20 @@ class RestClient():
         'Content-type': 'application/json'}
     """Headers send to the REST-API. SessionId added after login."""
 
+    __connection_retry = Retry(
+        total=3, read=False, backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    """Retries failed connections and overloaded-responses of idempotent requests within the session.
+    Read timeouts are not retried here, they are handled by adjusting the pagesize."""
+
+    __default_max_concurrent_requests = 4
+    """Default maximum of concurrent requests, also the count of kept-alive connections to the SPP-Server."""
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """maximum of requests sent concurrently to the SPP-Server, also the count of kept-alive connections"""
+        return self.__max_concurrent_requests
+
     def __init__(self, config_file: Dict[str, Any],
                  initial_connection_timeout: float,
                  pref_send_time: int,
@@ -49,6 +99,7 @@ class RestClient():
                  send_retries: int,
                  starting_page_size: int,
                  min_page_size: int,
+                 max_page_size: int,
                  verbose: bool):
 
         if(not config_file):
@@ -64,8 +115,10 @@ class RestClient():
         self.__initial_connection_timeout = initial_connection_timeout
 
         self.__preferred_time = pref_send_time
-        self.__page_size = starting_page_size
+        self.__starting_page_size = starting_page_size
+        """pagesize of the first page of each query, adjusted per query to avoid concurrent queries affecting each other"""
         self.__min_page_size = min_page_size
+        self.__max_page_size = max_page_size
         self.__send_retries = send_retries
 
         self.__verbose = verbose
@@ -77,8 +130,26 @@ class RestClient():
         except KeyError as error:
             raise ValueError("Not all REST-API Parameters are given", auth_rest) from error
 
+        # optional, lower this if the SPP-Server is unable to handle multiple requests at once
+        self.__max_concurrent_requests: int = auth_rest.get(
+            "max_concurrent_requests", self.__default_max_concurrent_requests)
+        if(not isinstance(self.__max_concurrent_requests, int) or self.__max_concurrent_requests < 1):
+            raise ValueError("max_concurrent_requests of the REST-API config needs to be a positive integer",
+                             self.__max_concurrent_requests)
+
         self.__sessionid: str = ""
         self.__srv_url: str = ""
+        self.__spp_version_build: Optional[Tuple[str, str]] = None
+        """version and build of the SPP-Server, queried once and shared by all callers"""
+
+        # keeps the connection alive, all requests reuse the same TLS-connection
+        self.__session = requests.Session()
+        self.__session.verify = False
+        self.__session.mount("https://", KeepAliveAdapter(
+            pool_connections=1, pool_maxsize=self.__max_concurrent_requests,
+            max_retries=self.__connection_retry))
+        # independent requests are sent concurrently, each one using its own connection of the pool
+        self.__request_executor = ThreadPoolExecutor(max_workers=self.__max_concurrent_requests)
 
     def login(self) -> None:
         """Logs in into the REST-API. Call this before using any methods.
@@ -92,7 +163,7 @@ class RestClient():
         self.__srv_url = "https://{srv_address}:{port}".format(srv_address=self.__srv_address, port=self.__srv_port)
         endpoint = "/api/endeavour/session"
 
-        LOGGER.debug(f"login to SPP REST API server: {self.__srv_url}")
+        LOGGER.debug("login to SPP REST API server: %s", self.__srv_url)
         if(self.__verbose):
             LOGGER.info(f"login to SPP REST API server: {self.__srv_url}")
         try:
@@ -105,10 +176,12 @@ class RestClient():
             raise ValueError(f"REST API login request not successfull.")
 
         self.__sessionid: str = response_json.get("sessionid", "")
+        # new session, server might have been upgraded in between
+        self.__spp_version_build = None
         (version, build) = self.get_spp_version_build()
 
-        LOGGER.debug(f"SPP-Version: {version}, build {build}")
-        LOGGER.debug(f"REST API Session ID: {self.__sessionid}")
+        LOGGER.debug("SPP-Version: %s, build %s", version, build)
+        LOGGER.debug("REST API Session ID: %s", self.__sessionid)
         if(self.__verbose):
             LOGGER.info(f"REST API Session ID: {self.__sessionid}")
             LOGGER.info(f"SPP-Version: {version}, build {build}")
@@ -125,10 +198,13 @@ class RestClient():
         """
         url = self.__srv_url + "/api/endeavour/session"
         try:
-            response_logout: Response = requests.delete(url, headers=self.__headers, verify=False) # type: ignore
+            response_logout: Response = self.__session.delete(url, headers=self.__headers, verify=False) # type: ignore
         except requests.exceptions.RequestException as error: # type: ignore
             ExceptionUtils.exception_info(error=error) # type: ignore
             raise ValueError("error when logging out")
+        finally:
+            self.__request_executor.shutdown(wait=False)
+            self.__session.close()
 
         if response_logout.status_code != 204:
             raise ValueError("Wrong Status code when logging out", response_logout.status_code) # type: ignore
@@ -140,15 +216,19 @@ class RestClient():
     def get_spp_version_build(self) -> Tuple[str, str]:
         """queries the spp version and build number.
 
+        The result is queried only once and reused on any later call, it does not change while logged in.
+
         Returns:
             Tuple[str, str] -- Tuple of (version_nr, build_nr)
         """
-        results = self.get_objects(
-            endpoint="/ngp/version",
-            white_list=["version", "build"],
-            add_time_stamp=False
-        )
-        return (results[0]["version"], results[0]["build"])
+        if(self.__spp_version_build is None):
+            results = self.get_objects(
+                endpoint="/ngp/version",
+                white_list=["version", "build"],
+                add_time_stamp=False
+            )
+            self.__spp_version_build = (results[0]["version"], results[0]["build"])
+        return self.__spp_version_build
 
     def get_objects(self,
                     endpoint: str = None, uri: str = None,
@@ -161,6 +241,7 @@ class RestClient():
         Use white_list to pick only the values specified.
         Use ignore_list to pick everything but the values specified.
         Both: white_list items overwrite ignore_list items, still getting all not filtered.
+        Use `get_object_pages` to process the results page by page instead.
 
         Note:
         Do not specify both endpoint and uri, only uri will be used
@@ -182,6 +263,41 @@ class RestClient():
         Returns:
             {List[Dict[str, Any]]} -- List of dictonarys as the results
         """
+        result_list: List[Dict[str, Any]] = []
+        for page_list in self.get_object_pages(
+                endpoint=endpoint, uri=uri, array_name=array_name,
+                white_list=white_list, ignore_list=ignore_list,
+                add_time_stamp=add_time_stamp):
+            result_list.extend(page_list)
+
+        LOGGER.debug("objectList size %d", len(result_list))
+        return result_list
+
+    def get_object_pages(self,
+                         endpoint: str = None, uri: str = None,
+                         array_name: str = None,
+                         white_list: List[str] = None, ignore_list: List[str] = None,
+                         add_time_stamp: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """Querys a response(-list) from a REST-API endpoint or URI, yielding the results page by page.
+
+        Same as `get_objects`, but only a single page is held in memory at once.
+        The next page is requested once the previous one got consumed.
+
+        Keyword Arguments:
+            endpoint {str} -- endpoint to be queried. Either use this or uri (default: {None})
+            uri {str} -- uri to be queried. Either use this or endpoint (default: {None})
+            array_name {str} -- name of array if there are multiple results wanted (default: {None})
+            white_list {list} -- list of item to query (default: {None})
+            ignore_list {list} -- query all but these items(-groups). (default: {None})
+            add_time_stamp {bool} -- whether to add the capture timestamp  (default: {False})
+
+        Raises:
+            ValueError: Neither a endpoint nor uri is specfied
+            ValueError: array_name is specified but it is only a single object
+
+        Yields:
+            {List[Dict[str, Any]]} -- filtered results of a single page
+        """
         if(not endpoint and not uri):
             raise ValueError("neiter endpoint nor uri specified")
         if(endpoint and uri):
@@ -196,15 +312,17 @@ class RestClient():
         else:
             next_page = uri
 
-        result_list: List[Dict[str, Any]] = []
+        collected_count: int = 0
+        # local to this query, concurrent queries must not shrink or grow each others pages
+        page_size: int = self.__starting_page_size
 
         # Aborts if no nextPage is found
         while(next_page):
-            LOGGER.debug(f"Collected {len(result_list)} items until now. Next page: {next_page}")
+            LOGGER.debug("Collected %d items until now. Next page: %s", collected_count, next_page)
             if(self.__verbose):
-                LOGGER.info(f"Collected {len(result_list)} items until now. Next page: {next_page}")
+                LOGGER.info(f"Collected {collected_count} items until now. Next page: {next_page}")
             # Request response
-            (response, send_time) = self.__query_url(url=next_page)
+            (response, send_time, page_size) = self.__query_url(url=next_page, page_size=page_size)
 
             # find follow page if available and set it
             (_, next_page_link) = SppUtils.get_nested_kv(key_name="links.nextPage.href", nested_dict=response)
@@ -216,39 +334,45 @@ class RestClient():
                 page_result_list: Optional[List[Dict[str, Any]]] = response.get(array_name, None)
                 if(page_result_list is None):
                     raise ValueError("array_name does not exist, this is probably a single object")
+                # an empty page is the end of the list, no need to request any following page
+                if(not page_result_list):
+                    break
             else:
                 page_result_list = [response]
 
+            add_values: Dict[str, Any] = {}
+            if(add_time_stamp): # direct time add to make the timestamps represent the real capture time
+                # all items of a page are captured at once, share a single timestamp
+                time_key, time_val = SppUtils.get_capture_timestamp_sec()
+                add_values[time_key] = time_val
+
+            # filter and add the timestamp within a single pass over the page
             filtered_results = ConnectionUtils.filter_values_dict(
                 result_list=page_result_list,
                 white_list=white_list,
-                ignore_list=ignore_list)
-
-            if(add_time_stamp): # direct time add to make the timestamps represent the real capture time
-                for mydict in filtered_results:
-                    time_key, time_val = SppUtils.get_capture_timestamp_sec()
-                    mydict[time_key] = time_val
-            result_list.extend(filtered_results)
-
+                ignore_list=ignore_list,
+                add_values=add_values)
+            collected_count += len(filtered_results)
 
             # adjust pagesize
-            if(send_time > self.__preferred_time or len(page_result_list) == self.__page_size):
-                self.__page_size = ConnectionUtils.adjust_page_size(
+            if(send_time > self.__preferred_time or len(page_result_list) == page_size):
+                page_size = ConnectionUtils.adjust_page_size(
                     page_size=len(page_result_list),
                     min_page_size=self.__min_page_size,
+                    max_page_size=self.__max_page_size,
                     preferred_time=self.__preferred_time,
                     send_time=send_time)
 
-        LOGGER.debug("objectList size %d", len(result_list))
-        return result_list
+            yield filtered_results
 
-    def __query_url(self, url: str) -> Tuple[Dict[str, Any], float]:
+    def __query_url(self, url: str, page_size: int) -> Tuple[Dict[str, Any], float, int]:
         """Sends a request to this endpoint. Repeats if timeout error occured.
 
         Adust the pagesize on timeout.
 
         Arguments:
             url {str} -- URL to be queried.
+            page_size {int} -- pagesize to be requested, reduced on timeout.
 
         Raises:
             ValueError: No URL specified
@@ -258,43 +382,31 @@ class RestClient():
             ValueError: Timeout when sending result
 
         Returns:
-            Tuple[Dict[str, Any], float] -- Result of the request with the required send time
+            Tuple[Dict[str, Any], float, int] -- Result of the request with the required send time and the used pagesize
         """
         if(not url):
             raise ValueError("no url specified")
 
-        LOGGER.debug(f"endpoint request {url}")
+        LOGGER.debug("endpoint request %s", url)
 
         failed_trys: int = 0
         response_query: Optional[Response] = None
         send_time: float = -1 # prevent unbound var
 
-        while(response_query is None):
+        # Always set Pagesize to avoid different pagesizes by system
+        # parse the url only once, each try only appends the actual pagesize
+        base_url = ConnectionUtils.url_set_param(url=url, param_name="pageSize")
+        page_size_separator = "&" if "?" in base_url else "?"
 
-            # read pagesize
-            actual_page_size = ConnectionUtils.url_get_param_value(url=url, param_name="pageSize")
+        while(response_query is None):
 
-             # Always set Pagesize to avoid different pagesizes by system
-            if(not actual_page_size):
-                url = ConnectionUtils.url_set_param(url=url, param_name="pageSize", param_value=self.__page_size)
-            else:
-                # read the pagesize
-                try:
-                    actual_page_size = int(actual_page_size[0])
-                except (ValueError, KeyError) as error:
-                    ExceptionUtils.exception_info(error, extra_message="invalid page size recorded")
-                    actual_page_size = -1
-
-            # adjust pagesize of url
-            if(actual_page_size != self.__page_size):
-                LOGGER.debug(f"setting new pageSize from {actual_page_size} to {self.__page_size}")
-                url = ConnectionUtils.url_set_param(url=url, param_name="pageSize", param_value=self.__page_size)
+            url = f"{base_url}{page_size_separator}pageSize={page_size}"
 
             # send the query
             try:
                 start_time = time.perf_counter()
-                response_query = requests.get( # type: ignore
-                    url=url, headers=self.__headers, verify=False,
+                response_query = self.__session.get( # type: ignore
+                    url=url, headers=self.__headers, verify=False, stream=True,
                     timeout=(self.__initial_connection_timeout, self.__timeout))
                 end_time = time.perf_counter()
                 send_time = (end_time - start_time)
@@ -312,31 +424,33 @@ class RestClient():
                     start_index = ConnectionUtils.url_get_param_value(url=url, param_name="pageStartIndex")
                     # report timeout with full information
                     raise ValueError("timeout after repeating a maximum ammount of times.",
-                                     timeout_error, failed_trys, self.__page_size, start_index)
+                                     timeout_error, failed_trys, page_size, start_index)
 
-                if(self.__page_size == self.__min_page_size):
+                if(page_size == self.__min_page_size):
                     ExceptionUtils.exception_info(error=timeout_error)
                     # read start index for debugging
                     start_index = ConnectionUtils.url_get_param_value(url=url, param_name="pageStartIndex")
                     # report timeout with full information
                     raise ValueError("timeout after using minumum pagesize. repeating the request is of no use.",
-                                     timeout_error, failed_trys, self.__page_size, start_index)
+                                     timeout_error, failed_trys, page_size, start_index)
 
                 # #### continuing cases ######
                 if(self.__send_retries == failed_trys): # last try
-                    LOGGER.debug(f"Timeout error when requesting, now last try of total {self.__send_retries}. Reducing pagesize to minimum for url: {url}")
+                    LOGGER.debug("Timeout error when requesting, now last try of total %s. Reducing pagesize to minimum for url: %s",
+                                 self.__send_retries, url)
                     if(self.__verbose):
                         LOGGER.info(f"Timeout error when requesting, now last try of total {self.__send_retries}. Reducing pagesize to minimum for url: {url}")
 
-                    self.__page_size = self.__min_page_size
+                    page_size = self.__min_page_size
                     # repeat with minimal possible size
 
                 else: # (self.__send_retries > failed_trys): # more then 1 try left
-                    LOGGER.debug(f"Timeout error when requesting, now on try {failed_trys} of {self.__send_retries}. Reducing pagesizefor url: {url}")
+                    LOGGER.debug("Timeout error when requesting, now on try %s of %s. Reducing pagesizefor url: %s",
+                                 failed_trys, self.__send_retries, url)
                     if(self.__verbose):
                         LOGGER.info(f"Timeout error when requesting, now on try {failed_trys} of {self.__send_retries}. Reducing pagesize for url: {url}")
-                    self.__page_size = ConnectionUtils.adjust_page_size(
-                        page_size=self.__page_size,
+                    page_size = ConnectionUtils.adjust_page_size(
+                        page_size=page_size,
                         min_page_size=self.__min_page_size,
                         time_out=True)
                     # repeat with reduced page size
@@ -346,15 +460,47 @@ class RestClient():
                 raise ValueError("error when requesting endpoint", error)
 
         if response_query.status_code != 200:
+            response_query.close()
             raise ValueError("Wrong Status code when requesting endpoint data",
                              response_query.status_code, url, response_query)
 
         try:
-            response_json: Dict[str, Any] = response_query.json()
+            # body is streamed, the read time is part of the send time
+            start_time = time.perf_counter()
+            response_json: Dict[str, Any] = self.__parse_streamed_json(response_query)
+            send_time += time.perf_counter() - start_time
         except (json.decoder.JSONDecodeError, ValueError) as error: # type: ignore
             raise ValueError("failed to parse query in restAPI post request", response_query) # type: ignore
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as error: # type: ignore
+            ExceptionUtils.exception_info(error=error) # type: ignore
+            raise ValueError("error when reading endpoint response", error)
+        finally:
+            response_query.close()
+
+        return (response_json, send_time, page_size)
+
+    @staticmethod
+    def __parse_streamed_json(response: Response) -> Dict[str, Any]:
+        """Parses the body of a response requested with `stream=True` as json.
 
-        return (response_json, send_time)
+        The whole body is read from the socket with a single read instead of small chunks, then decoded.
+        Uses `orjson` if it is installed.
+
+        Arguments:
+            response {Response} -- streamed response, body not yet read
+
+        Raises:
+            ValueError: body is not a valid json
+
+        Returns:
+            Dict[str, Any] -- parsed body
+        """
+        response.raw.decode_content = True
+        body = response.raw.read()
+        if(orjson):
+            # orjson.JSONDecodeError is a subclass of json.decoder.JSONDecodeError
+            return orjson.loads(body)
+        return json.loads(body)
 
     def post_data(self, endpoint: str = None, url: str = None, post_data: str = None,
                   auth: HTTPBasicAuth = None) -> Dict[str, Any]: # type: ignore
@@ -389,15 +535,15 @@ class RestClient():
         if(not url):
             url = self.__srv_url + endpoint
 
-        LOGGER.debug(f"post_data request {url} {post_data} {auth}")
+        LOGGER.debug("post_data request %s %s %s", url, post_data, auth)
 
         try:
             if(post_data):
-                response_query: Response = requests.post( # type: ignore
+                response_query: Response = self.__session.post( # type: ignore
                     url, headers=self.__headers, data=post_data, verify=False,
                     timeout=(self.__initial_connection_timeout, self.__timeout))
             else:
-                response_query: Response = requests.post( # type: ignore
+                response_query: Response = self.__session.post( # type: ignore
                     url, headers=self.__headers, auth=auth, verify=False,
                     timeout=(self.__initial_connection_timeout, self.__timeout))
         except requests.exceptions.RequestException as error: # type: ignore
@@ -415,3 +561,33 @@ class RestClient():
                              response_query, endpoint, post_data) # type: ignore
 
         return response_json
+
+    def post_data_list(self, query_list: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Queries multiple endpoints by concurrent POST-Requests.
+
+        The requests are independent of each other, therefore they are sent at the same time.
+        At most `max_concurrent_requests` (sppServer config) requests are in flight at once.
+        Results are returned in the same order as the queries.
+
+        Arguments:
+            query_list {List[Tuple[str, str]]} -- List of tuples (endpoint, post_data)
+
+        Raises:
+            ValueError: no query list specified
+            ValueError: any error of `post_data`, raised for the first failed query
+
+        Returns:
+            List[Dict[str, Any]] -- list of the results, one for each query
+        """
+        if(query_list is None):
+            raise ValueError("need a list of queries to post data")
+
+        future_list: List[Future[Dict[str, Any]]] = []
+        for (endpoint, post_data) in query_list:
+            future_list.append(self.__request_executor.submit(
+                self.post_data,
+                endpoint=endpoint,
+                post_data=post_data
+            ))
+
+        return [future.result() for future in future_list]
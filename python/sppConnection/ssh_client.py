@@ -45,6 +45,8 @@ class SshCommand:
         save_result - Save the result and return a new SshCommand instance.
 
     """
+    __slots__ = ("__cmd", "__parse_function", "__table_name", "__result", "__host_name")
+    """a copy is created for each client and command on every run, no instance dict required"""
 
     @property
     def cmd(self) -> str:
@@ -199,7 +201,7 @@ class SshClient:
         if(not commands or not isinstance(commands, list)):
             raise ValueError("Need list of commands to execute")
 
-        LOGGER.debug(f"> connecting to {self.client_type.name} client on host {self.host_name}")
+        LOGGER.debug("> connecting to %s client on host %s", self.client_type.name, self.host_name)
         if(verbose):
             LOGGER.info(f"> connecting to {self.client_type.name} client on host {self.host_name}")
 
@@ -214,12 +216,12 @@ class SshClient:
         for ssh_command in commands:
 
             try:
-                LOGGER.debug(f"Executing command {ssh_command.cmd} on host {self.host_name}")
+                LOGGER.debug("Executing command %s on host %s", ssh_command.cmd, self.host_name)
                 result = self.__send_command(ssh_command.cmd)
 
                 # save result
                 new_command = ssh_command.save_result(result, self.host_name)
-                LOGGER.debug(f"Command result: {result}")
+                LOGGER.debug("Command result: %s", result)
 
             except ValueError as error:
                 ExceptionUtils.exception_info(
@@ -254,7 +256,7 @@ class SshClient:
         if(not ssh_command or not ssh_command):
             raise ValueError("need command to execute")
 
-        LOGGER.debug(f">> excecuting command:   {ssh_command}")
+        LOGGER.debug(">> excecuting command:   %s", ssh_command)
 
         try:
             (_, ssh_stdout, _) = self.__client_ssh.exec_command(ssh_command) # type: ignore
@@ -53,7 +53,6 @@ Author:
 
 """
 from __future__ import annotations
-import functools
 import logging
 from optparse import OptionParser
 import os
@@ -136,8 +135,6 @@ parser.add_option("--dashboard_folder_path", dest="dashboard_folder_path",
 
 (OPTIONS, ARGS) = parser.parse_args()
 
-print = functools.partial(print, flush=True) # type: ignore
-
 LOGGER_NAME = 'sppmon'
 LOGGER = logging.getLogger(LOGGER_NAME)
 
@@ -245,6 +242,11 @@ class SppMon:
     loaded_min_page_size: int = 1
     """minimum size of a rest-api page on loaded systems"""
 
+    max_page_size: int = 50000
+    """maximum size of a rest-api page, limits the growth of the dynamical page size"""
+    loaded_max_page_size: int = 5000
+    """maximum size of a rest-api page on loaded systems"""
+
     # possible options: '["INFO","DEBUG","ERROR","SUMMARY","WARN"]'
     joblog_types: str = '["INFO","DEBUG","ERROR","SUMMARY","WARN"]'
     """regular joblog query types on normal running systems"""
@@ -274,7 +276,9 @@ class SppMon:
         self.set_logger()
 
         LOGGER.info("Starting SPPMon")
-        if(not self.check_pid_file()):
+        # utility operations do not collect any data, running them in parallel is harmless
+        # skipping the check avoids a `ps` call for each registered pid
+        if(not OPTIONS.test and not OPTIONS.create_dashboard and not self.check_pid_file()):
             ExceptionUtils.error_message("Another instance of sppmon with the same args is running")
             self.exit(ERROR_CODE_CMD_LINE)
 
@@ -285,9 +289,9 @@ class SppMon:
         time_stamp_name, time_stamp = SppUtils.get_capture_timestamp_sec()
         self.start_counter = time.perf_counter()
         LOGGER.debug("\n\n")
-        LOGGER.debug(f"running script version: {VERSION}")
-        LOGGER.debug(f"cmdline options: {OPTIONS}")
-        LOGGER.debug(f"{time_stamp_name}: {time_stamp}")
+        LOGGER.debug("running script version: %s", VERSION)
+        LOGGER.debug("cmdline options: %s", OPTIONS)
+        LOGGER.debug("%s: %s", time_stamp_name, time_stamp)
         LOGGER.debug("")
 
         if(not OPTIONS.confFileJSON):
@@ -319,7 +323,8 @@ class SppMon:
             file_handler = logging.FileHandler(self.log_path)
         except Exception as error:
             # TODO here: Right exception, how to print this error?
-            print("unable to open logger")
+            # logger is not available yet
+            print("unable to open logger", file=sys.stderr)
             raise ValueError("Unable to open Logger") from error
 
 
@@ -344,11 +349,15 @@ class SppMon:
         if(OPTIONS.verbose):
             LOGGER.info("Checking for other SPPMon instances")
         self.pid_file_path = SppUtils.filename_of_config(OPTIONS.confFileJSON, ".pid_file")
+        # identifies the instance together with the pid, computed once
+        options = str(OPTIONS)
         try:
             try:
+                # read only once, also used to remove entries of killed processes below
                 file = open(self.pid_file_path, "rt")
-                match_list = re.findall(r"(\d+) " + str(OPTIONS), file.read())
+                file_str = file.read()
                 file.close()
+                match_list = re.findall(r"(\d+) " + options, file_str)
                 deleted_processes: List[str] = []
                 for match in match_list:
                     # add spaces to make clear the whole number is matched
@@ -368,10 +377,6 @@ class SppMon:
 
                 # delete processes which did get killed, not often called
                 if(deleted_processes):
-                    file = open(self.pid_file_path, "rt")
-                    file_str = file.read()
-                    file.close()
-                    options = str(OPTIONS)
                     for pid in deleted_processes:
                         file_str = file_str.replace(f"{pid} {options}", "")
                     # do not delete if empty since we will use it below
@@ -384,7 +389,7 @@ class SppMon:
 
             # always write your own pid into it
             file = open(self.pid_file_path, "at")
-            file.write(f"{os.getpid()} {str(OPTIONS)}")
+            file.write(f"{os.getpid()} {options}")
             file.close()
             return True
         except Exception as error:
@@ -392,6 +397,9 @@ class SppMon:
             raise ValueError("Error when checking pid file")
 
     def remove_pid_file(self) -> None:
+        # not registered, nothing to remove
+        if(not self.pid_file_path):
+            return
         try:
             file = open(self.pid_file_path, "rt")
             file_str = file.read()
@@ -463,6 +471,7 @@ class SppMon:
                     send_retries=self.loaded_send_retries,
                     starting_page_size=self.loaded_starting_page_size,
                     min_page_size=self.loaded_min_page_size,
+                    max_page_size=self.loaded_max_page_size,
                     verbose=OPTIONS.verbose
                 )
             else:
@@ -479,6 +488,7 @@ class SppMon:
                     send_retries=self.send_retries,
                     starting_page_size=self.starting_page_size,
                     min_page_size=self.min_page_size,
+                    max_page_size=self.max_page_size,
                     verbose=OPTIONS.verbose
                 )
 
@@ -646,7 +656,8 @@ class SppMon:
                 table_name="sppmon_metrics",
                 list_with_dicts=[insert_dict]
             )
-            self.influx_client.flush_insert_buffer()
+            # wait for the send to report its errors before checking them
+            self.influx_client.flush_insert_buffer(wait=True)
             LOGGER.info("Stored script metrics sucessfull")
             # + 1 due the "total of x exception/s occured"
             if(error_count + 1 < len(ExceptionUtils.stored_errors)):
@@ -704,7 +715,7 @@ class SppMon:
         if(error_code == ERROR_CODE or error_code):
             ExceptionUtils.error_message("Error occured while executing sppmon")
 
-        print(f"check log for details: grep \"PID {os.getpid()}\" {self.log_path} > sppmon.log.{os.getpid()}")
+        LOGGER.info(f"check log for details: grep \"PID {os.getpid()}\" {self.log_path} > sppmon.log.{os.getpid()}")
         sys.exit(error_code)
 
     def main(self):
@@ -715,11 +726,12 @@ class SppMon:
             ExceptionUtils.error_message("somehow no influx client is present even after init")
             self.exit(ERROR_CODE)
 
+        # each section waits for its flushed inserts to be sent, so send errors are reported within that section.
         # ##################### SYSTEM METHODS #######################
         if(self.sites and self.system_methods):
             try:
                 self.system_methods.sites()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -728,7 +740,7 @@ class SppMon:
         if(self.cpu and self.system_methods):
             try:
                 self.system_methods.cpuram()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -737,7 +749,7 @@ class SppMon:
         if(self.spp_catalog and self.system_methods):
             try:
                 self.system_methods.sppcatalog()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -748,7 +760,7 @@ class SppMon:
             # store all jobs grouped by jobID
             try:
                 self.job_methods.get_all_jobs()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -758,7 +770,7 @@ class SppMon:
             # store all job logs per job session instance
             try:
                 self.job_methods.job_logs()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -770,7 +782,7 @@ class SppMon:
              # store all job logs per job session instance
             try:
                 self.ssh_methods.ssh()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -780,7 +792,7 @@ class SppMon:
         if(self.vms and self.protection_methods):
             try:
                 self.protection_methods.store_vms()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -791,7 +803,7 @@ class SppMon:
             try:
                 self.protection_methods.vms_per_sla()
                 self.protection_methods.sla_dumps()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -801,7 +813,7 @@ class SppMon:
             # retrieve and calculate VM inventory summary
             try:
                 self.protection_methods.create_inventory_summary()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -810,7 +822,7 @@ class SppMon:
         if(self.vadps and self.protection_methods):
             try:
                 self.protection_methods.vadps()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
@@ -819,7 +831,7 @@ class SppMon:
         if(self.storages and self.protection_methods):
             try:
                 self.protection_methods.storages()
-                self.influx_client.flush_insert_buffer()
+                self.influx_client.flush_insert_buffer(wait=True)
             except ValueError as error:
                 ExceptionUtils.exception_info(
                     error=error,
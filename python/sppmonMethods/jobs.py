@@ -4,11 +4,11 @@ You may implement new job methods in here.
 Classes:
     JobMethods
 """
-import datetime
 import json
 import logging
-import time
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 from influx.influx_client import InfluxClient
 from influx.influx_queries import Keyword, SelectionQuery
@@ -157,6 +157,12 @@ class JobMethods:
     }
     """LogLog messageID's which can be parsed by sppmon. Check detailed summary above the declaration."""
 
+    __additional_field_names: Dict[str, List[Tuple[str, str]]] = {
+        message_id: [(field, field) if isinstance(field, str) else field for field in additional_fields]
+        for (message_id, (_, _, additional_fields)) in __supported_ids.items()
+    }
+    """Additional fields of each supported messageID, normalized once into (name, source key) tuples."""
+
     def __init__(self, influx_client: Optional[InfluxClient], api_queries: Optional[ApiQueries],
                  job_log_retention_time: str, job_log_type: str, verbose: bool):
 
@@ -179,11 +185,19 @@ class JobMethods:
     def get_all_jobs(self) -> None:
         """incrementally saves all stored jobsessions, even before first execution of sppmon"""
 
-        job_list = MethodUtils.query_something(
-            name="job list",
-            source_func=self.__api_queries.get_job_list
-        )
+        # the job list (REST) and the stored jobsessions (influx) are independent: both are requested at once.
+        # query the stored jobsessions of all jobs at once instead of one query per job
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stored_ids_future = executor.submit(self.__stored_job_ids)
 
+            job_list = MethodUtils.query_something(
+                name="job list",
+                source_func=self.__api_queries.get_job_list
+            )
+
+            stored_ids_by_job = stored_ids_future.result()
+
+        valid_jobs: List[Tuple[str, str]] = []
         for job in job_list:
             job_id = job.get("id", None)
             job_name = job.get("name", None)
@@ -193,62 +207,146 @@ class JobMethods:
                 ExceptionUtils.error_message(
                     f"skipping, missing name or id for job {job}")
                 continue
+            valid_jobs.append((job_id, job_name))
+
+        # calculate time to be requested once, so all jobs share the same limit
+        table = self.__influx_client.database['jobs']
+        (rp_hours, rp_mins, rp_secs) = InfluxUtils.transform_time_literal(
+            table.retention_policy.duration, single_vals=True)
+        # integer epoch arithmetic, no datetime/struct_time conversion required
+        rp_total_secs = int(rp_hours) * 3600 + int(rp_mins) * 60 + int(rp_secs)
+        # make it ms instead of s
+        min_start_time = (SppUtils.get_actual_time_sec() - rp_total_secs) * 1000
+
+        # the jobsessions of each job are independent: they are requested in parallel,
+        # bounded by the concurrent request limit of the REST client.
+        # each job is stored in order, the next job is only submitted after one is consumed,
+        # so the workers cannot run ahead and pile up the jobsessions of all jobs in memory.
+        max_pending = self.__api_queries.max_concurrent_requests
+        with ThreadPoolExecutor(max_workers=max_pending) as executor:
+            pending_jobs: Deque[Tuple[str, str, Future[List[Dict[str, Any]]]]] = deque()
+            for (job_id, job_name) in valid_jobs:
+                pending_jobs.append((job_id, job_name, executor.submit(
+                    self.__missing_jobs_by_id, job_id, stored_ids_by_job.get(str(job_id), set()), min_start_time)))
+
+                if(len(pending_jobs) >= max_pending):
+                    self.__store_pending_job(*pending_jobs.popleft(), stored_ids_by_job=stored_ids_by_job)
+
+            while(pending_jobs):
+                self.__store_pending_job(*pending_jobs.popleft(), stored_ids_by_job=stored_ids_by_job)
+
+        # TODO: artifact from older versions, not replaced yet
+        if self.__verbose:
+            self.__print_last_jobs([job_id for (job_id, _) in valid_jobs])
+
+    def __store_pending_job(self, job_id: str, job_name: str,
+                            missing_jobs_future: Future, stored_ids_by_job: Dict[str, Set[int]]) -> None:
+        """Waits for the requested jobsessions of a job and saves them.
+
+        Arguments:
+            job_id {str} -- id of the job
+            job_name {str} -- name of the job, used for logging
+            missing_jobs_future {Future} -- request of the jobsessions which are not stored yet
+            stored_ids_by_job {Dict[str, Set[int]]} -- stored jobsession ids grouped by their jobId
+        """
+        LOGGER.info(
+            ">> capturing Job information for Job \"{}\"".format(job_name))
+        if(str(job_id) not in stored_ids_by_job):
             LOGGER.info(
-                ">> capturing Job information for Job \"{}\"".format(job_name))
+                f">>> no entries in Influx database found for job with id {job_id}")
 
-            try:
-                self.__job_by_id(job_id=job_id)
-            except ValueError as error:
-                ExceptionUtils.exception_info(
-                    error=error, extra_message=f"error when getting jobs for {job_name}, skipping it")
-                continue
+        try:
+            self.__job_by_id(job_id=job_id, missing_jobs=missing_jobs_future.result())
+        except ValueError as error:
+            ExceptionUtils.exception_info(
+                error=error, extra_message=f"error when getting jobs for {job_name}, skipping it")
 
-    def __job_by_id(self, job_id: str) -> None:
-        """Requests and saves all jobsessions for a jobID"""
-        if(not job_id):
-            raise ValueError("need job_id to request jobs for that ID")
+    def __print_last_jobs(self, job_ids: List[str]) -> None:
+        """Displays the last stored jobsessions of each given jobID.
 
+        Queries the jobsessions of all jobs at once, grouped by their jobId.
+        Each group is displayed with its jobId, jobs without stored jobsessions are not displayed.
+
+        Arguments:
+            job_ids {List[str]} -- ids of the jobs to be displayed
+        """
+        display_number_of_jobs = 5
+        table = self.__influx_client.database['jobs']
+        # limit applies per group, a single query for all jobs instead of one per job
+        query = SelectionQuery(
+            keyword=Keyword.SELECT,
+            fields=['*'],
+            tables=[table],
+            group_list=['jobId'],
+            order_direction='DESC',
+            limit=display_number_of_jobs
+        )
+        result = self.__influx_client.send_selection_query( # type: ignore
+            query)  # type: ignore
+
+        displayed_job_ids = set(str(job_id) for job_id in job_ids)
+        # one series per job, the jobId is only returned as tag of the series
+        for ((_, tags), points) in result.items(): # type: ignore
+            job_id = tags.get('jobId', None) if tags else None
+            if(job_id not in displayed_job_ids):
+                continue
+            job_list_to_print: List[Dict[str, Any]] = [dict(row, jobId=job_id) for row in points]
+            print()
+            print("displaying last {} jobs for job with ID {} from database (as available)".format(
+                display_number_of_jobs, job_id))
+            MethodUtils.my_print(data=job_list_to_print)
+
+    def __stored_job_ids(self) -> Dict[str, Set[int]]:
+        """Queries the ids of all jobsessions stored within the influxdb, grouped by their jobId"""
         keyword = Keyword.SELECT
         table = self.__influx_client.database['jobs']
         query = SelectionQuery(
             keyword=keyword,
-            fields=['id', 'jobName'],
+            fields=['id', 'jobId'],
             tables=[table],
-            where_str=f'jobId = \'{job_id}\' AND time > now() - {table.retention_policy.duration}'
-            # unnecessary filter?
+            where_str=f'time > now() - {table.retention_policy.duration}'
         )
-        LOGGER.debug(query)
         result = self.__influx_client.send_selection_query(  # type: ignore
             query)
-        id_list: List[int] = []
-        row: Dict[str, Any] = {}  # make sure the var exists
+
+        stored_ids_by_job: Dict[str, Set[int]] = {}
         for row in result.get_points():  # type: ignore
-            id_list.append(row['id'])  # type: ignore
+            stored_ids_by_job.setdefault(row['jobId'], set()).add(row['id'])  # type: ignore
+        return stored_ids_by_job
 
-        if(not row):
-            LOGGER.info(
-                f">>> no entries in Influx database found for job with id {job_id}")
+    def __missing_jobs_by_id(self, job_id: str, stored_ids: Set[int], min_start_time: int) -> List[Dict[str, Any]]:
+        """Requests all jobsessions for a jobID, returning the ones within the retention time which are not stored yet.
 
-        # calculate time to be requested
-        (rp_hours, rp_mins, rp_secs) = InfluxUtils.transform_time_literal(
-            table.retention_policy.duration, single_vals=True)
-        max_request_timestamp = datetime.datetime.now() - datetime.timedelta(
-            hours=float(rp_hours),
-            minutes=float(rp_mins),
-            seconds=float(rp_secs)
-        )
-        unixtime = int(time.mktime(max_request_timestamp.timetuple()))
-        # make it ms instead of s
-        unixtime *= 1000
+        Does not access the influxdb, therefore it may be called in background.
+
+        Arguments:
+            job_id {str} -- id of the job to request the jobsessions for
+            stored_ids {Set[int]} -- ids of the jobsessions already stored within the influxdb
+            min_start_time {int} -- epoch in ms, older jobsessions would be dropped by the retention policy
+
+        Raises:
+            ValueError: No job_id given
+            ValueError: Error when requesting the jobsessions
+
+        Returns:
+            List[Dict[str, Any]] -- jobsessions missing within the influxdb
+        """
+        if(not job_id):
+            raise ValueError("need job_id to request jobs for that ID")
 
         # retrieve all jobs in this category from REST API, filter to avoid drops due RP
-        LOGGER.debug(f">>> requesting job sessions for id {job_id}")
+        LOGGER.debug(">>> requesting job sessions for id %s", job_id)
         all_jobs = self.__api_queries.get_jobs_by_id(job_id=job_id)
 
         # filter all jobs where start time is not bigger then the retention time limit
-        latest_jobs = list(filter(lambda job: job['start'] > unixtime, all_jobs))
+        # and which are not stored yet, both checked within a single pass
+        return [job for job in all_jobs
+                if job['start'] > min_start_time and int(job['id']) not in stored_ids]
 
-        missing_jobs = list(filter(lambda job_api: int(job_api['id']) not in id_list, latest_jobs))
+    def __job_by_id(self, job_id: str, missing_jobs: List[Dict[str, Any]]) -> None:
+        """Saves the jobsessions of a jobID which are not stored yet"""
+        if(not job_id):
+            raise ValueError("need job_id to save jobs for that ID")
 
         if(len(missing_jobs) > 0):
             LOGGER.info(
@@ -265,33 +363,6 @@ class JobMethods:
             LOGGER.info(
                 f">>> no new jobs to insert into DB for job with ID {job_id}")
 
-        # TODO: artifact from older versions, not replaced yet
-        if self.__verbose:
-            display_number_of_jobs = 5
-            keyword = Keyword.SELECT
-            table = self.__influx_client.database['jobs']
-            where_str = 'jobId = \'{}\''.format(job_id)
-            query = SelectionQuery(
-                keyword=keyword,
-                fields=['*'],
-                tables=[table],
-                where_str=where_str,
-                order_direction='DESC',
-                limit=display_number_of_jobs
-            )
-            result = self.__influx_client.send_selection_query( # type: ignore
-                query)  # type: ignore
-            result_list: List[str] = list(
-                result.get_points())  # type: ignore
-
-            job_list_to_print: List[str] = []
-            for row_str in result_list:
-                job_list_to_print.append(row_str)
-            print()
-            print("displaying last {} jobs for job with ID {} from database (as available)".format(
-                display_number_of_jobs, job_id))
-            MethodUtils.my_print(data=job_list_to_print)
-
     def __compute_extra_job_stats(self, list_with_jobs: List[Dict[str, Any]], job_id: str) -> None:
         """Extracts additional `statistic` list from jobs and removes it from the original list.
 
@@ -308,6 +379,25 @@ class JobMethods:
         for job in filter(lambda x: x.get("statistics", None) is not None, list_with_jobs):
             job_statistics_list = job.pop('statistics')
 
+            # the job values are the same for each of its statistics, collected only once
+            try:
+                job_values: Dict[str, Any] = {
+                    # time key
+                    'start': job['start'],
+                    # regular tag values for grouping:
+                    'id': job.get('id', None),
+                    'jobId': job.get('jobId', None),
+                    'status': job.get('status', None),
+                    'indexStatus': job.get('indexStatus', None),
+                    'jobName': job.get('jobName', None),
+                    'type': job.get('type', None),
+                    'subPolicyType': job.get('subPolicyType', None),
+                }
+            except KeyError as error:
+                ExceptionUtils.exception_info(error=error, extra_message=
+                f"failed to compute job-individual statistics due key error. report to developer. Job: {job}")
+                continue
+
             for job_stats in job_statistics_list:
                 try:
                     insert_dict: Dict[str, Any] = {}
@@ -322,16 +412,7 @@ class JobMethods:
                        skipped = insert_dict["total"] - insert_dict["success"] - insert_dict["failed"]
                     insert_dict["skipped"] = skipped
 
-                    # time key
-                    insert_dict['start'] = job['start']
-                    # regular tag values for grouping:
-                    insert_dict['id'] = job.get('id', None)
-                    insert_dict['jobId'] = job.get('jobId', None)
-                    insert_dict['status'] = job.get('status', None)
-                    insert_dict['indexStatus'] = job.get('indexStatus', None)
-                    insert_dict['jobName'] = job.get('jobName', None)
-                    insert_dict['type'] = job.get('type', None)
-                    insert_dict['subPolicyType'] = job.get('subPolicyType', None)
+                    insert_dict.update(job_values)
 
                     insert_list.append(insert_dict)
                 except KeyError as error:
@@ -368,7 +449,8 @@ class JobMethods:
 
             table_func_triple = self.__supported_ids[message_id]
 
-            (table_name, row_dict_func, additional_fields) = table_func_triple
+            (table_name, row_dict_func, _) = table_func_triple
+            additional_fields = self.__additional_field_names[message_id]
 
             if(not table_name):
                 table_name = message_id
@@ -382,14 +464,9 @@ class JobMethods:
                     # No warning cause this will happen often.
                     continue
                 # Saving additional fields from the job_log struct itself.
-                if(additional_fields):
-                    for value in additional_fields:
-                        # with rename
-                        if(isinstance(value, Tuple)):
-                            row_dict[value[0]] = job_log[value[1]]
-                        else:
-                            # without rename
-                            row_dict[value] = job_log[value]
+                # renames are resolved once at class level, no type check per log required
+                for (name, source_key) in additional_fields:
+                    row_dict[name] = job_log[source_key]
             except (KeyError, IndexError) as error:
                 ExceptionUtils.exception_info(
                     error, extra_message=f"MessageID params wrong defined. Skipping message_id {message_id} with content: {job_log}")
@@ -425,6 +502,29 @@ class JobMethods:
 
             self.__influx_client.insert_dicts_to_buffer(table_name, [row_dict])
 
+    def __request_job_logs(self, job_session_id: int) -> List[Dict[str, Any]]:
+        """Requests all jobLogs of a single jobsession, used to request them in background.
+
+        Arguments:
+            job_session_id {int} -- id of the jobsession to request the jobLogs for
+
+        Raises:
+            ValueError: Error when requesting the jobLogs
+
+        Returns:
+            List[Dict[str, Any]] -- jobLogs of the jobsession
+        """
+        if(self.__verbose):
+            LOGGER.info(
+                f"requesting jobLogs {self.__job_log_type} for session {job_session_id}.")
+        LOGGER.debug(
+            "requesting jobLogs %s for session %s.", self.__job_log_type, job_session_id)
+
+        # cant use query something like everwhere due the extra params needed
+        return self.__api_queries.get_job_log_details(
+            jobsession_id=job_session_id,
+            job_logs_type=self.__job_log_type)
+
     def job_logs(self) -> None:
         """saves all jobLogs for the jobsessions in influx catalog.
 
@@ -462,10 +562,12 @@ class JobMethods:
         LOGGER.info(">>> number of jobs with no joblogs stored in Influx database: {}"
                     .format(rows_affected))
 
-        job_log_dict: Dict[int, List[Dict[str, Any]]] = {}
+        # list to be inserted after everything is updated
+        insert_list: List[Dict[str, Any]] = []
+        requested_ids: Set[int] = set()
 
-        # request all jobLogs from REST-API
-        # if errors occur, skip single row and debug
+        # validate all rows first, so the jobLogs of the next jobsession can be requested in background
+        session_rows: List[Tuple[int, Dict[str, Any]]] = []
         for row in result_list:
             job_session_id: Optional[int] = row.get('id', None)
 
@@ -475,109 +577,89 @@ class JobMethods:
                     f"Error: joblogId missing for row {row}")
                 continue
 
-            if(job_session_id in job_log_dict):
+            if(job_session_id in requested_ids):
                 ExceptionUtils.error_message(
                     f"Error: joblogId duplicate, skipping.{job_session_id}")
                 continue
 
-            if(self.__verbose):
-                LOGGER.info(
-                    f">>> requested joblogs for {len(job_log_dict)} / {rows_affected} job sessions.")
-            elif(len(job_log_dict) % 5 == 0):
-                LOGGER.info(
-                    f">>> requested joblogs for {len(job_log_dict)} / {rows_affected} job sessions.")
-
-            # request job_session_id
-            try:
-                if(self.__verbose):
-                    LOGGER.info(
-                        f"requesting jobLogs {self.__job_log_type} for session {job_session_id}.")
-                LOGGER.debug(
-                    f"requesting jobLogs {self.__job_log_type} for session {job_session_id}.")
-
-                # cant use query something like everwhere due the extra params needed
-                job_log_list = self.__api_queries.get_job_log_details(
-                    jobsession_id=job_session_id,
-                    job_logs_type=self.__job_log_type)
-            except ValueError as error:
-                ExceptionUtils.exception_info(
-                    error=error,
-                    extra_message=f"error when api-requesting joblogs for job_session_id {job_session_id}, skipping it")
-                continue
-
-            if(self.__verbose):
-                LOGGER.info(
-                    f">>> Found {len(job_log_list)} logs for jobsessionId {job_session_id}")
+            requested_ids.add(job_session_id)
+            session_rows.append((job_session_id, row))
 
-            LOGGER.debug(
-                f"Found {len(job_log_list)} logs for jobsessionId {job_session_id}")
-            # default empty list if no details available -> should not happen, in for safty reasons
-            # if this is none, go down to rest client and fix it. Should be empty list.
-            if(job_log_list is None):
-                job_log_list = []
-                ExceptionUtils.error_message(
-                    "A joblog_list was none, even if the type does not allow it. Please report to developers.")
-            job_log_dict[job_session_id] = job_log_list
-
-        # list to be inserted after everything is updated
-        insert_list: List[Dict[str, Any]] = []
+        # request all jobLogs from REST-API, each jobsession is stored directly after its request
+        # while the next one is already requested. So at most the logs of two jobsessions are kept in memory.
+        # if errors occur, skip single row and debug
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_future: Optional[Future[List[Dict[str, Any]]]] = None
+            if(session_rows):
+                next_future = executor.submit(self.__request_job_logs, session_rows[0][0])
 
-        # Query data in ranges to avoid too many requests
-        # Results from first select query above
-        for row in result_list:
-            job_id: int = row['id']
-            job_log_list: Optional[List[Dict[str, Any]]
-                                   ] = job_log_dict.get(job_id, None)
+            for (index, (job_session_id, row)) in enumerate(session_rows):
+                job_log_future = next_future
+                if(index + 1 < len(session_rows)):
+                    next_future = executor.submit(self.__request_job_logs, session_rows[index + 1][0])
 
-            if(job_log_list is None):
-                ExceptionUtils.error_message(
-                    f"missing job_log_list even though it is in influxdb for jobId {job_id}. Skipping it")
-                continue
+                if(self.__verbose or index % 5 == 0):
+                    LOGGER.info(
+                        f">>> requested joblogs for {index} / {rows_affected} job sessions.")
 
-            # jobLogsCount will be zero if jobLogs are deleted after X days by maintenance jobs, GUI default is 60 days
-            job_logs_count = len(job_log_list)
-            if(self.__verbose):
-                LOGGER.info(">>> storing {} joblogs for jobsessionId: {} in Influx database".format(
-                    len(job_log_list), job_id))
-            LOGGER.debug(">>> storing {} joblogs for jobsessionId: {} in Influx database".format(
-                len(job_log_list), job_id))
-
-            for job_log in job_log_list:
-                # rename log keys and add additional information
-                job_log["jobId"] = row.get("jobId", None)
-                job_log["jobName"] = row.get("jobName", None)
-                job_log["jobExecutionTime"] = row.get("start", None)
-                job_log["jobLogId"] = job_log.pop("id")
-                job_log["jobSessionId"] = job_log.pop("jobsessionId")
-
-            # compute other stats out of jobList
-            try:
-                self.__job_logs_to_stats(job_log_list)
-            except ValueError as error:
-                ExceptionUtils.exception_info(
-                    error, extra_message=f"Failed to compute stats out of job logs, skipping for jobsessionId {job_id}")
+                # request job_session_id
+                try:
+                    job_log_list = job_log_future.result()  # type: ignore
+                except ValueError as error:
+                    ExceptionUtils.exception_info(
+                        error=error,
+                        extra_message=f"error when api-requesting joblogs for job_session_id {job_session_id}, skipping it")
+                    continue
 
-            for job_log in job_log_list:
-                # dump message params to allow saving as string
-                job_log["messageParams"] = json.dumps(job_log["messageParams"])
+                # default empty list if no details available -> should not happen, in for safty reasons
+                # if this is none, go down to rest client and fix it. Should be empty list.
+                if(job_log_list is None):
+                    job_log_list = []
+                    ExceptionUtils.error_message(
+                        "A joblog_list was none, even if the type does not allow it. Please report to developers.")
 
-            # if list is empty due beeing erased etc it will simply return and do nothing
-            self.__influx_client.insert_dicts_to_buffer(
-                list_with_dicts=job_log_list, table_name="jobLogs")
-
-            jobs_updated += 1
-            logs_total_count += job_logs_count
-            # update job table and set jobsLogsStored = True, jobLogsCount = len(jobLogDetails)
-            update_fields = {
-                "jobLogsCount": job_logs_count,
-                "jobsLogsStored": True
-            }
-            # copy dict to allow update without errors
-            mydict = dict(row.items())
-            # update fields
-            for(key, value) in update_fields.items():
-                mydict[key] = value
-            insert_list.append(mydict)
+                # jobLogsCount will be zero if jobLogs are deleted after X days by maintenance jobs, GUI default is 60 days
+                job_logs_count = len(job_log_list)
+                if(self.__verbose):
+                    LOGGER.info(">>> storing {} joblogs for jobsessionId: {} in Influx database".format(
+                        job_logs_count, job_session_id))
+                LOGGER.debug(">>> storing %d joblogs for jobsessionId: %s in Influx database",
+                             job_logs_count, job_session_id)
+
+                # same for each log of this jobsession
+                job_id = row.get("jobId", None)
+                job_name = row.get("jobName", None)
+                job_execution_time = row.get("start", None)
+                for job_log in job_log_list:
+                    # rename log keys and add additional information
+                    job_log["jobId"] = job_id
+                    job_log["jobName"] = job_name
+                    job_log["jobExecutionTime"] = job_execution_time
+                    job_log["jobLogId"] = job_log.pop("id")
+                    job_log["jobSessionId"] = job_log.pop("jobsessionId")
+
+                # compute other stats out of jobList
+                try:
+                    self.__job_logs_to_stats(job_log_list)
+                except ValueError as error:
+                    ExceptionUtils.exception_info(
+                        error, extra_message=f"Failed to compute stats out of job logs, skipping for jobsessionId {job_session_id}")
+
+                for job_log in job_log_list:
+                    # dump message params to allow saving as string
+                    job_log["messageParams"] = json.dumps(job_log["messageParams"])
+
+                # if list is empty due beeing erased etc it will simply return and do nothing
+                self.__influx_client.insert_dicts_to_buffer(
+                    list_with_dicts=job_log_list, table_name="jobLogs")
+
+                jobs_updated += 1
+                logs_total_count += job_logs_count
+                # update job table and set jobsLogsStored = True, jobLogsCount = len(jobLogDetails)
+                # the row is not used otherwise, so it is updated in place instead of a copy
+                row["jobLogsCount"] = job_logs_count
+                row["jobsLogsStored"] = True
+                insert_list.append(row)
 
         # Delete data to allow reinsert with different tags
         delete_query = SelectionQuery(
@@ -34,6 +34,9 @@ class ProtectionMethods:
 
     """
 
+    __sla_dump_where_template: str = "time = {time_stamp}ms AND slaId = \'{sla_id}\'"
+    """where clause of the sla dump update, only time and slaId are filled in per row"""
+
     def __init__(self, system_methods: Optional[SystemMethods], influx_client: Optional[InfluxClient],
                  api_queries: Optional[ApiQueries], verbose: bool):
 
@@ -49,6 +52,9 @@ class ProtectionMethods:
         self.__api_queries = api_queries
         self.__verbose = verbose
 
+        self.__vms_incomplete: bool = False
+        """set while the vm pages are stored, stays set if the pagination fails midway"""
+
     def vms_per_sla(self) -> None:
         """Calculates the number of VM's per SLA. Hypervisors not supported yet."""
         LOGGER.info("> calculating number of VMs per SLA")
@@ -85,8 +91,8 @@ class ProtectionMethods:
                 table_name=table_name,
                 tag_dic=tag_dic,
                 field_dic=field_dic,
-                where_str="time = {}ms AND slaId = \'{}\'".format(
-                    time_stamp, sla_id)
+                where_str=self.__sla_dump_where_template.format(
+                    time_stamp=time_stamp, sla_id=sla_id)
             )
 
     def vadps(self) -> None:
@@ -141,21 +147,29 @@ class ProtectionMethods:
 
         Those are reused later to compute vm_stats
         """
-        all_vms_list = MethodUtils.query_something(
-            name="all VMs",
-            source_func=self.__api_queries.get_all_vms,
-            rename_tuples=[
-                ("properties.datacenter.name", "datacenterName")
-            ],
-            deactivate_verbose=True)
+        LOGGER.info("> getting all VMs")
+
+        # each page is inserted directly, so only a single page of vm's is kept in memory
+        # a failing page leaves a partial capture, which must not be used for the vm stats
+        self.__vms_incomplete = True
+        vm_count: int = 0
+        for vm_page in self.__api_queries.get_all_vms():
+            for vm in vm_page:
+                # rename fields to make it more informative.
+                vm["datacenterName"] = vm.pop("properties.datacenter.name")
+            vm_count += len(vm_page)
+
+            self.__influx_client.insert_dicts_to_buffer(
+                table_name="vms",
+                list_with_dicts=vm_page
+            )
+        self.__vms_incomplete = False
 
-        if(self.__verbose):
-            LOGGER.info(f"found {len(all_vms_list)} vm's.")
+        if(not vm_count):
+            ExceptionUtils.error_message(">> No all VMs are found")
 
-        self.__influx_client.insert_dicts_to_buffer(
-            table_name="vms",
-            list_with_dicts=all_vms_list
-        )
+        if(self.__verbose):
+            LOGGER.info(f"found {vm_count} vm's.")
 
 
     def create_inventory_summary(self) -> None:
@@ -164,6 +178,9 @@ class ProtectionMethods:
         LOGGER.info(
             "> computing inventory information (not from catalog, means not only backup data is calculated)")
 
+        if(self.__vms_incomplete):
+            raise ValueError("storing the vm's did not finish, skipping the statistics of the partial capture")
+
         # ########## Part 1: Check if something need to be computed #############
         # query the timestamp of the last vm, commited as a field is always needed by influx rules.
         vms_table = self.__influx_client.database["vms"]
@@ -188,15 +205,16 @@ class ProtectionMethods:
 
         vm_stats_table = self.__influx_client.database["vmStats"]
 
+        # only the existence is checked, vmCount is always set by this method
         vm_stats_query = SelectionQuery(
             keyword=Keyword.SELECT,
             tables=[vm_stats_table],
-            fields=['*'],
+            fields=['vmCount'],
             where_str=where_str,
             limit=1
         )
         result = self.__influx_client.send_selection_query(vm_stats_query) # type: ignore
-        if(len(list(result.get_points())) > 0): # type: ignore
+        if(next(result.get_points(), None) is not None): # type: ignore
             LOGGER.info(">> vm statistics already computed, skipping")
             return
 
@@ -231,40 +249,48 @@ class ProtectionMethods:
 
         vm_stats: Dict[str, Any] = {}
         try:
+            # extract each column once, all stats are computed by builtins on those
+            commited_list: List[int] = [vm['commited'] for vm in all_vms_list]
+            uptime_list: List[int] = [vm['uptime'] for vm in all_vms_list]
+            protected_list = [vm['isProtected'] for vm in all_vms_list]
+            encrypted_list = [vm['isEncrypted'] for vm in all_vms_list]
+            hlo_list = [vm['inHLO'] for vm in all_vms_list]
+            hypervisor_list = [vm['hypervisorType'] for vm in all_vms_list]
+
             vm_stats['vmCount'] = len(all_vms_list)
 
             # returns largest/smallest
-            vm_stats['vmMaxSize'] = max(all_vms_list, key=(lambda mydict: mydict['commited']))['commited']
+            vm_stats['vmMaxSize'] = max(commited_list)
             #  on purpose zero size vm's are ignored
-            vms_no_null_size = list(filter(lambda mydict: mydict['commited'] > 0, all_vms_list))
+            vms_no_null_size = [commited for commited in commited_list if commited > 0]
             if(vms_no_null_size):
-                vm_stats['vmMinSize'] = min(vms_no_null_size, key=(lambda mydict: mydict['commited']))['commited']
-            vm_stats['vmSizeTotal'] = sum(mydict['commited'] for mydict in all_vms_list)
+                vm_stats['vmMinSize'] = min(vms_no_null_size)
+            vm_stats['vmSizeTotal'] = sum(commited_list)
             vm_stats['vmAvgSize'] = vm_stats['vmSizeTotal'] / vm_stats['vmCount']
 
              # returns largest/smallest
-            vm_stats['vmMaxUptime'] = max(all_vms_list, key=(lambda mydict: mydict['uptime']))['uptime']
+            vm_stats['vmMaxUptime'] = max(uptime_list)
             #  on purpose zero size vm's are ignored
-            vms_no_null_time = list(filter(lambda mydict: mydict['uptime'] > 0, all_vms_list))
+            vms_no_null_time = [uptime for uptime in uptime_list if uptime > 0]
             if(vms_no_null_time):
-                vm_stats['vmMinUptime'] = min(vms_no_null_time, key=(lambda mydict: mydict['uptime']))['uptime']
-            vm_stats['vmUptimeTotal'] = sum(mydict['uptime'] for mydict in all_vms_list)
+                vm_stats['vmMinUptime'] = min(vms_no_null_time)
+            vm_stats['vmUptimeTotal'] = sum(uptime_list)
             vm_stats['vmAvgUptime'] = vm_stats['vmUptimeTotal'] / vm_stats['vmCount']
 
-            vm_stats['vmCountProtected'] = len(list(filter(lambda mydict: mydict['isProtected'] == "True", all_vms_list)))
+            vm_stats['vmCountProtected'] = protected_list.count("True")
             vm_stats['vmCountUnprotected'] = vm_stats['vmCount'] - vm_stats['vmCountProtected']
-            vm_stats['vmCountEncrypted'] = len(list(filter(lambda mydict: mydict['isEncrypted'] == "True", all_vms_list)))
+            vm_stats['vmCountEncrypted'] = encrypted_list.count("True")
             vm_stats['vmCountPlain'] = vm_stats['vmCount'] - vm_stats['vmCountEncrypted']
-            vm_stats['vmCountHLO'] = len(list(filter(lambda mydict: mydict['inHLO'] == "True", all_vms_list)))
+            vm_stats['vmCountHLO'] = hlo_list.count("True")
             vm_stats['vmCountNotHLO'] = vm_stats['vmCount'] - vm_stats['vmCountHLO']
 
 
-            vm_stats['vmCountVMware'] = len(list(filter(lambda mydict: mydict['hypervisorType'] == "vmware", all_vms_list)))
-            vm_stats['vmCountHyperV'] = len(list(filter(lambda mydict: mydict['hypervisorType'] == "hyperv", all_vms_list)))
+            vm_stats['vmCountVMware'] = hypervisor_list.count("vmware")
+            vm_stats['vmCountHyperV'] = hypervisor_list.count("hyperv")
 
 
-            vm_stats['nrDataCenters'] = len(set(map(lambda vm: vm['datacenterName'], all_vms_list)))
-            vm_stats['nrHosts'] = len(set(map(lambda vm: vm['host'], all_vms_list)))
+            vm_stats['nrDataCenters'] = len({vm['datacenterName'] for vm in all_vms_list})
+            vm_stats['nrHosts'] = len({vm['host'] for vm in all_vms_list})
 
             vm_stats['time'] = all_vms_list[0]['time']
 
@@ -7,7 +7,7 @@ Classes:
 import json
 import logging
 import re
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Set, Tuple
 
 from influx.influx_client import InfluxClient
 from sppConnection.ssh_client import SshClient, SshCommand, SshTypes
@@ -35,6 +35,45 @@ class SshMethods:
 
     """
 
+    __mpstat_pattern = re.compile(r"(.*)\s+\((.*)\)\s+(\d{2}\/\d{2}\/\d{4})\s+(\S*)\s+\((\d+)\sCPU\)")
+    """Pattern of the first mpstat line, compiled once instead of on each parse."""
+
+    __mpstat_group_names: Tuple[str, ...] = ("name", "host", "date", "system_type", "cpu_count")
+    """Names of the matching groups of the first mpstat line, in order."""
+
+    __pool_show_paths: List[Tuple[str, List[str]]] = [
+        (path.split('.')[-1], path.split('.')) for path in [
+            'compression',
+            'compression_ratio',
+            'deduplication',
+            'deduplication_ratio',
+            'diskgroup_size',
+            'encryption.enabled',
+            'health',
+            'id',
+            'name',
+            'pool_type',
+            'size_before_compression',
+            'size_before_deduplication',
+            'size_free',
+            'size_total',
+            'size_used',
+            'status'
+        ]]
+    """White list of the pool show command as (key, path), split once instead of for each item of each pool."""
+
+    __pool_size_keys: List[str] = [
+        'size_before_compression',
+        'size_before_deduplication',
+        'size_free',
+        'size_total',
+        'size_used'
+    ]
+    """Sizes of the pool show command which are converted from bytes to megabytes."""
+
+    __bytes_per_megabyte: int = pow(2, 20)
+    """Bytes of one megabyte, used to convert the pool sizes."""
+
     @property
     def all_command_list(self) -> List[SshCommand]:
         """Commands to be executed on every ssh-client"""
@@ -171,7 +210,18 @@ class SshMethods:
             raise ValueError("not a list of sshconfig given", auth_ssh)
 
         ssh_clients: List[SshClient] = []
+        # copy-pasted config entries would execute and store each command twice
+        known_clients: Set[Tuple[Any, Any, Any, str]] = set()
         for client_ssh in auth_ssh:
+            client_key = (
+                client_ssh.get("srv_address", None), client_ssh.get("srv_port", None),
+                client_ssh.get("username", None), str(client_ssh.get("type", "")).upper())
+            if(client_key in known_clients):
+                ExceptionUtils.error_message(
+                    f"ssh-client {client_ssh.get('name', 'ERROR WHEN GETTING NAME')} is declared multiple times, skipping duplicate.")
+                continue
+            known_clients.add(client_key)
+
             try:
                 ssh_clients.append(SshClient(client_ssh))
             except ValueError as error:
@@ -243,17 +293,17 @@ class SshMethods:
             raise ValueError("need table name to insert parsed value")
         result_lines = ssh_command.result.splitlines()
         header = result_lines[0].split()
-        values: List[Dict[str, Any]] = list(
-            map(lambda row: dict(zip(header, row.split())), result_lines[1:])) # type: ignore
-
         # remove top statistic itself to avoid spam with useless information
-        values = list(filter(lambda row: row["COMMAND"] in self.__ps_grep_list, values))
+        values: List[Dict[str, Any]] = [
+            row for row in (dict(zip(header, line.split())) for line in result_lines[1:])
+            if row["COMMAND"] in self.__ps_grep_list]
 
+        # all rows of one result share the same capture time
+        (time_key, time_value) = SppUtils.get_capture_timestamp_sec()
         for row in values:
             # set default needed fields
             row['hostName'] = ssh_command.host_name
             row['ssh_type'] = ssh_type.name
-            (time_key, time_value) = SppUtils.get_capture_timestamp_sec()
             row[time_key] = time_value
 
             row['TIME+'] = row.pop('ELAPSED')
@@ -296,45 +346,20 @@ class SshMethods:
 
             pool_dict: Dict[str, Any] = {}
 
-            # acts as white list
-            insert_list = [
-                'compression',
-                'compression_ratio',
-                'deduplication',
-                'deduplication_ratio',
-                'diskgroup_size',
-                'encryption.enabled',
-                'health',
-                'id',
-                'name',
-                'pool_type',
-                'size_before_compression',
-                'size_before_deduplication',
-                'size_free',
-                'size_total',
-                'size_used',
-                'status'
-            ]
-            for item in insert_list:
-                (key, value) = SppUtils.get_nested_kv(item, pool)
-                pool_dict[key] = value
+            if(not pool or not isinstance(pool, dict)):
+                raise ValueError("need dictonary to find elem within it")
+            # using the pre-split paths
+            for (key, key_list) in SshMethods.__pool_show_paths:
+                pool_dict[key] = SppUtils.get_nested_value(key_list=key_list, nested_dict=pool)
 
             # rename
             pool_dict['encryption_enabled'] = pool_dict.pop('enabled')
 
             # change unit from bytes to megabytes
             try:
-                sz_b_c = SppUtils.parse_unit(pool_dict['size_before_compression'])
-                sz_b_d = SppUtils.parse_unit(pool_dict['size_before_deduplication'])
-                sz_fr = SppUtils.parse_unit(pool_dict['size_free'])
-                sz_t = SppUtils.parse_unit(pool_dict['size_total'])
-                sz_u = SppUtils.parse_unit(pool_dict['size_used'])
-
-                pool_dict['size_before_compression'] = int(sz_b_c / pow(2, 20)) if sz_b_c else None
-                pool_dict['size_before_deduplication'] = int(sz_b_d / pow(2, 20)) if sz_b_d else None
-                pool_dict['size_free'] = int(sz_fr / pow(2, 20)) if sz_fr else None
-                pool_dict['size_total'] = int(sz_t / pow(2, 20)) if sz_t else None
-                pool_dict['size_used'] = int(sz_u / pow(2, 20)) if sz_u else None
+                sizes = [SppUtils.parse_unit(pool_dict[size_key]) for size_key in SshMethods.__pool_size_keys]
+                for (size_key, size) in zip(SshMethods.__pool_size_keys, sizes):
+                    pool_dict[size_key] = int(size / SshMethods.__bytes_per_megabyte) if size else None
             except KeyError as error:
                 ExceptionUtils.exception_info(
                     error=error, extra_message=f"failed to reduce size of vsnap pool size for {pool_dict}")
@@ -412,9 +437,10 @@ class SshMethods:
 
         # remove "on"
         header.pop()
-        values: List[Dict[str, Any]] = list(
-            map(lambda row: dict(zip(header, row.split())), result_lines[1:])) # type: ignore
+        values: List[Dict[str, Any]] = [dict(zip(header, line.split())) for line in result_lines[1:]]
 
+        # all rows of one result share the same capture time
+        (time_key, time_value) = SppUtils.get_capture_timestamp_sec()
         for row in values:
             if("1G-blocks" in row):
                 row["Size"] = row.pop("1G-blocks")
@@ -428,7 +454,6 @@ class SshMethods:
             # set default needed fields
             row['hostName'] = ssh_command.host_name
             row['ssh_type'] = ssh_type
-            (time_key, time_value) = SppUtils.get_capture_timestamp_sec()
             row[time_key] = time_value
 
         return (ssh_command.table_name, values)
@@ -455,8 +480,6 @@ class SshMethods:
         if(not ssh_command.table_name):
             raise ValueError("need table name to insert parsed value")
 
-        pattern = re.compile(r"(.*)\s+\((.*)\)\s+(\d{2}\/\d{2}\/\d{4})\s+(\S*)\s+\((\d+)\sCPU\)")
-
         result_lines = ssh_command.result.splitlines()
 
         header = result_lines[2].split()
@@ -476,7 +499,7 @@ class SshMethods:
         values[time_key] = time_value
 
         # zip between the exec information and the names for the matching group
-        match = re.match(pattern, result_lines[0])
+        match = SshMethods.__mpstat_pattern.match(result_lines[0])
         if(not match):
             raise ValueError(
                 "the mpstat values are not in the expected pattern",
@@ -484,9 +507,7 @@ class SshMethods:
                 ssh_command,
                 ssh_type)
 
-        for (key, value) in zip(["name", "host", "date", "system_type", "cpu_count"], match.groups()):
-
-            values[key] = value
+        values.update(zip(SshMethods.__mpstat_group_names, match.groups()))
 
         # replace it with capture time
         values.pop('date')
@@ -39,6 +39,8 @@ class SystemMethods:
 
         # filled by `sites` or `site_name_by_id`
         self.__site_name_dict: Dict[int, str] = {}
+        # whether `site_name_by_id` already queried all stored sites
+        self.__all_sites_queried: bool = False
 
     def sppcatalog(self) -> None:
         """Saves the spp filesystem catalog information."""
@@ -83,7 +85,7 @@ class SystemMethods:
     def site_name_by_id(self, site_id: Union[int, str]) -> Optional[str]:
         """Returns a site_name by a associated site_id.
 
-        Uses a already buffered result if possible, otherwise queries the influxdb for the name.
+        Uses a already buffered result if possible, otherwise queries the influxdb once for the names of all sites.
 
         Arguments:
             site_id {Union[int, str]} -- id of the site
@@ -112,27 +114,39 @@ class SystemMethods:
         if(result is not None): # empty str allowed
             return result
 
-        table_name = 'sites'
-        table = self.__influx_client.database[table_name]
-        query = SelectionQuery(
-            keyword=Keyword.SELECT,
-            tables=[table],
-            # description, throttleRates cause we need a field to query
-            fields=["siteId", "siteName", "description", "throttleRates"],
-            where_str=f"siteId = \'{site_id}\'",
-            order_direction="DESC",
-            limit=1
-        )
-        result_set = self.__influx_client.send_selection_query(query) # type: ignore
-        result_dict: Dict[str, Any] = next(result_set.get_points(), None) # type: ignore
-        if(not result_dict):
-            ExceptionUtils.error_message(f"no site with the id {site_id} exists")
-            return None
-
-        # save result and return it
-        result = result_dict['siteName']
-        self.__site_name_dict[site_id] = result
-        return result
+        # all stored sites are queried at once on the first miss, each later miss is unknown anyway
+        if(not self.__all_sites_queried):
+            self.__all_sites_queried = True
+            table_name = 'sites'
+            table = self.__influx_client.database[table_name]
+            query = SelectionQuery(
+                keyword=Keyword.SELECT,
+                tables=[table],
+                # description, throttleRates cause we need a field to query
+                fields=["siteName", "description", "throttleRates"],
+                group_list=["siteId"],
+                order_direction="DESC",
+                limit=1
+            )
+            result_set = self.__influx_client.send_selection_query(query) # type: ignore
+            # one series per site, containing only the latest entry
+            for ((_, tags), points) in result_set.items(): # type: ignore
+                result_dict: Optional[Dict[str, Any]] = next(points, None)
+                if(not tags or not result_dict):
+                    continue
+                try:
+                    stored_site_id = int(tags['siteId'])
+                except (KeyError, ValueError):
+                    continue
+                # do not overwrite names saved by `sites`
+                self.__site_name_dict.setdefault(stored_site_id, result_dict['siteName'])
+
+            result = self.__site_name_dict.get(site_id, None)
+            if(result is not None):
+                return result
+
+        ExceptionUtils.error_message(f"no site with the id {site_id} exists")
+        return None
 
     def sites(self) -> None:
         """Collects all site informations including throttle rate.
@@ -5,11 +5,11 @@ Classes:
     ConnectionUtils
 """
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import urllib.parse as parse
 
-from utils.spp_utils import SppUtils
 from utils.execption_utils import ExceptionUtils
+from utils.spp_utils import SppUtils
 
 
 LOGGER = logging.getLogger("sppmon")
@@ -169,6 +169,7 @@ class ConnectionUtils:
     def adjust_page_size(cls,
                          page_size: int,
                          min_page_size: int,
+                         max_page_size: int = None,
                          preferred_time: float = None,
                          send_time: float = None,
                          time_out: bool = False) -> int:
@@ -180,6 +181,7 @@ class ConnectionUtils:
         Args:
             page_size (int): actually used pagesize
             min_page_size (int): minimum allowed pagesize
+            max_page_size (int, optional): maximum allowed pagesize, unlimited if None. Defaults to None.
             preferred_time (float, optional): the perfect send time. Defaults to None.
             send_time (float, optional): the actual send time. Defaults to None.
             time_out (bool, optional): if the requests timed out. Defaults to False.
@@ -205,7 +207,7 @@ class ConnectionUtils:
             # reduce pagesize
             new_page_size = int(page_size - (size_over_limit * cls.timeout_reduction))
 
-            LOGGER.debug(f"reducing pagesize due timeout, from {page_size} to {new_page_size}.")
+            LOGGER.debug("reducing pagesize due timeout, from %s to %s.", page_size, new_page_size)
             if(cls.verbose):
                 LOGGER.info(f"reducing pagesize due timeout, from {page_size} to {new_page_size}.")
             return new_page_size
@@ -213,7 +215,7 @@ class ConnectionUtils:
         time_difference_quota = send_time / preferred_time
 
         if(abs(time_difference_quota-1) > cls.allowed_send_delta):
-            LOGGER.debug(f"adjusting page size due too high time difference, actual: {send_time}, preferred: {preferred_time}")
+            LOGGER.debug("adjusting page size due too high time difference, actual: %s, preferred: %s", send_time, preferred_time)
             if(cls.verbose):
                 LOGGER.info(f"adjusting page size due too high time difference, actual: {send_time}, preferred: {preferred_time}")
 
@@ -229,7 +231,11 @@ class ConnectionUtils:
             if(new_page_size < min_page_size + 5):
                 new_page_size = min_page_size + 5
 
-            LOGGER.debug(f"changed page size from {page_size} to {new_page_size}")
+            # avoid pages too large for the server to handle
+            if(max_page_size is not None and new_page_size > max_page_size):
+                new_page_size = max_page_size
+
+            LOGGER.debug("changed page size from %d to %d", page_size, new_page_size)
             if(cls.verbose):
                 LOGGER.info(f"changed page size from {page_size} to {new_page_size}")
 
@@ -242,17 +248,20 @@ class ConnectionUtils:
     def filter_values_dict(cls,
                            result_list: List[Dict[str, Any]],
                            white_list: List[str] = None,
-                           ignore_list: List[str] = None) -> List[Dict[str, Any]]:
+                           ignore_list: List[str] = None,
+                           add_values: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Removes unwanted values from a list of dicts.
 
         Use white_list to only pick the values specified.
         Use ignore_list to pick everything but the values specified
         Both: white_list itmes overwrite ignore_list times, still getting all items not filterd.
+        Use add_values to add the same values to each filtered dict within the same pass.
 
         Args:
             result_list (List[Dict[str, Any]]): items to be filtered
             white_list (List[str], optional): items to be kept. Defaults to None.
             ignore_list (List[str], optional): items to be removed. Defaults to None.
+            add_values (Dict[str, Any], optional): values added to each filtered item. Defaults to None.
 
         Raises:
             ValueError: no result list specified
@@ -267,6 +276,16 @@ class ConnectionUtils:
 
         new_result_list: List[Dict[str, Any]] = []
 
+        # the white_list is the same for all items: split the paths only once
+        # looked up by `SppUtils.get_nested_value`, without splitting the path for each item
+        white_paths: List[Tuple[str, str, List[str]]] = []
+        if(white_list):
+            for white_key in white_list:
+                if(not white_key or not isinstance(white_key, str)):
+                    raise ValueError("need path to key as string to find elem.")
+                key_list = white_key.split('.')
+                white_paths.append((white_key, key_list[-1], key_list))
+
         # if single object this is a 1 elem list
         for result in result_list:
 
@@ -274,9 +293,12 @@ class ConnectionUtils:
 
             # Only aquire items wanted
             if(white_list):
+                if(not result or not isinstance(result, dict)):
+                    raise ValueError("need dictonary to find elem within it")
+
+                for (white_key, key, key_list) in white_paths:
+                    value = SppUtils.get_nested_value(key_list=key_list, nested_dict=result)
 
-                for white_key in white_list:
-                    (key, value) = SppUtils.get_nested_kv(key_name=white_key, nested_dict=result)
                     if(key in new_result):
                         key = white_key
                     new_result[key] = value
@@ -292,6 +314,9 @@ class ConnectionUtils:
                 full_result = cls.get_with_sub_values(mydict=result, ignore_list=ignore_list)
                 new_result.update(full_result)
 
+            if(add_values):
+                new_result.update(add_values)
+
             new_result_list.append(new_result)
 
         return new_result_list
@@ -6,7 +6,8 @@ Classes:
 """
 import re
 import logging
-from typing import Dict, Tuple, Union, Any, List
+from functools import lru_cache
+from typing import Dict, Pattern, Tuple, Union, Any, List
 
 from utils.spp_utils import SppUtils
 from utils.execption_utils import ExceptionUtils
@@ -29,10 +30,22 @@ class InfluxUtils:
     time_key_names: List[str] = ['time', SppUtils.capture_time_key, "logTime"]
     """default time_key names."""
 
+    __escape_patterns: Dict[str, Pattern[str]] = {}
+    """compiled escape pattern per escaped char, there are only few distinct ones"""
+
+    __secs_per_hour: int = pow(60, 2)
+    """seconds of a hour, used to split time literals"""
+
+    __secs_per_minute: int = pow(60, 1)
+    """seconds of a minute, used to split time literals"""
+
     @staticmethod
+    @lru_cache(maxsize=128)
     def check_time_literal(value: str) -> bool:
         """Checks wheather the str is consistend as influxdb time literal
 
+        Results are cached, the same few intervals are checked for each continuous query.
+
         Args:
             value (str): time literal to be checked
 
@@ -52,10 +65,12 @@ class InfluxUtils:
         return False
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def transform_time_literal(value: str, single_vals: bool = False) -> Union[str, Tuple[int, int, int]]:
         """Transforms a time literal into hour/min/seconds literal.
 
         Checks before if the literal is valid.
+        Results are cached, only few distinct literals (retention policy durations) are transformed repeatedly.
 
         Args:
             value (str): time literal to be transformed
@@ -83,11 +98,11 @@ class InfluxUtils:
         for (_, numbers, unit) in match_list: # full is first, but unused
             time_s += SppUtils.parse_unit(numbers, unit)
 
-        hours = int(time_s / pow(60, 2))
-        time_s = time_s % pow(60, 2)
+        hours = int(time_s / InfluxUtils.__secs_per_hour)
+        time_s = time_s % InfluxUtils.__secs_per_hour
 
-        mins = int(time_s / pow(60, 1))
-        seconds = int(time_s % pow(60, 1))
+        mins = int(time_s / InfluxUtils.__secs_per_minute)
+        seconds = int(time_s % InfluxUtils.__secs_per_minute)
         if(single_vals):
             return (hours, mins, seconds)
         return f"{hours}h{mins}m{seconds}s"
@@ -101,10 +116,7 @@ class InfluxUtils:
 
         Arguments:
             value {str} -- string which should get escaped
-
-        Keyword Arguments:
-            unwanted_char {str} -- a single char you want to escape (default: {None})
-            unwanted_char_list {list} -- list of chars you want to escape (default: {None})
+            replace_list {List[Tuple[str, str]]} -- plain chars to be escaped with their escaped version (old, new)
 
         Raises:
             ValueError: Neither single nor list of chars is given
@@ -119,8 +131,14 @@ class InfluxUtils:
         value = '{}'.format(value)
 
         for(old, new) in replace_list:
-            pattern = re.compile(r'((?<!\\{1})(?:\\{2})*)' + old)
-            value = re.sub(pattern, r'\1'+new, value)
+            # most values contain none of the chars, skip the regex for those
+            if(old not in value):
+                continue
+            pattern = InfluxUtils.__escape_patterns.get(old, None)
+            if(pattern is None):
+                pattern = re.compile(r'((?<!\\{1})(?:\\{2})*)' + old)
+                InfluxUtils.__escape_patterns[old] = pattern
+            value = pattern.sub(r'\1'+new, value)
 
         return value
 
@@ -148,7 +166,7 @@ class InfluxUtils:
             raise ValueError("at least one entry is required to split")
 
         ExceptionUtils.error_message("WARNING: Using default split method, one table is set up only temporary")
-        LOGGER.debug(f"default split args: {mydict}")
+        LOGGER.debug("default split args: %s", mydict)
 
         # In case only fields are recognized
         fields: Dict[str, Union[float, int, bool, str]] = {}
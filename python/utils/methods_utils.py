@@ -7,9 +7,10 @@ Classes:
 import logging
 import json
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from pprint import pprint
-from typing import Callable, List, Match, Tuple, Dict, Any, Union, Set
+from typing import Callable, List, Match, Optional, Tuple, Dict, Any, Union, Set
 from prettytable import PrettyTable
 from sppConnection.ssh_client import SshClient, SshCommand, SshTypes
 
@@ -23,6 +24,7 @@ class MethodUtils:
 
     Attributes:
         verbose - to be set in sppmon.py
+        ssh_max_workers - maximum count of ssh clients queried at the same time
 
     Methods:
         get_with_sub_values - Extends a dict by possible sub-dicts in its values, recursive.
@@ -34,6 +36,12 @@ class MethodUtils:
     verbose: bool = False
     """whether to verbose print, set in sppmon.py"""
 
+    ssh_max_workers: int = 16
+    """maximum count of ssh clients queried at the same time"""
+
+    __ssh_executor: Optional[ThreadPoolExecutor] = None
+    """thread pool shared by all ssh queries, created on first use"""
+
     @classmethod
     def ssh_execute_commands(cls, ssh_clients: List[SshClient], ssh_type: SshTypes,
                              command_list: List[SshCommand]) -> List[Tuple[str, List[Dict[str, Any]]]]:
@@ -54,39 +62,50 @@ class MethodUtils:
 
         client_list = list(filter(lambda client: client.client_type is ssh_type, ssh_clients))
         if(not client_list):
-            LOGGER.debug(f"No {ssh_type.name} ssh client present. Aborting command")
+            LOGGER.debug("No %s ssh client present. Aborting command", ssh_type.name)
             if(cls.verbose):
                 LOGGER.info(f"No {ssh_type.name} ssh client present. Aborting command")
             return []
 
-        ssh_cmd_response_list = []
+        ssh_cmd_response_list: List[Dict[str, Any]] = []
         result_list: List[Tuple[str, List[Dict[str, Any]]]] = []
-        for client in client_list:
 
+        # each client is independent, query them all at once. Results are collected in the original order.
+        # the pool is reused for all types, threads are only started once
+        if(cls.__ssh_executor is None):
+            cls.__ssh_executor = ThreadPoolExecutor(max_workers=cls.ssh_max_workers)
+
+        future_list: List[Future[List[SshCommand]]] = []
+        for client in client_list:
             if(cls.verbose):
                 LOGGER.info(f">> executing {ssh_type.name} command(s) on host {client.host_name}")
 
+            future_list.append(cls.__ssh_executor.submit(
+                client.execute_commands,
+                commands=command_list,
+                verbose=cls.verbose
+            ))
+
+        for future in future_list:
+
             try:
-                result_commands = client.execute_commands(
-                    commands=command_list,
-                    verbose=cls.verbose
-                )
+                result_commands = future.result()
 
             except ValueError as error:
                 ExceptionUtils.exception_info(error=error, extra_message="Error when executing commands, skipping this client")
                 continue
 
-            for ssh_command in result_commands:
-                insert_dict = {}
-                insert_dict["host"] = ssh_command.host_name
-                insert_dict["command"] = ssh_command.cmd
-                insert_dict["output"] = json.dumps(ssh_command.result)
-                insert_dict['ssh_type'] = ssh_type.name
-                time_key, time_value = SppUtils.get_capture_timestamp_sec()
-                insert_dict[time_key] = time_value
-
-                ssh_cmd_response_list.append(insert_dict)
+            # all commands of a client are finished at once, share a single timestamp
+            time_key, time_value = SppUtils.get_capture_timestamp_sec()
+            ssh_cmd_response_list.extend({
+                "host": ssh_command.host_name,
+                "command": ssh_command.cmd,
+                "output": json.dumps(ssh_command.result),
+                "ssh_type": ssh_type.name,
+                time_key: time_value
+            } for ssh_command in result_commands)
 
+            for ssh_command in result_commands:
                 try:
                     table_result_tuple = ssh_command.parse_result(ssh_type=ssh_type)
                     if(table_result_tuple):
@@ -170,18 +189,11 @@ class MethodUtils:
         # make sure every row has all keys, fill with None
         # cast to list to have one order
         row_keys = list(row_keys_unorderd)
-        row_val_list: List[List[Any]] = []
-        for row in data:
-            row_vals: List[Any] = []
-            for key in row_keys:
-                # save value in fixed ordering
-                row_vals.append(row.get(key, None))
-            row_val_list.append(row_vals)
 
-        # create table
+        # create table, each row saves its values in the fixed key ordering
         table = PrettyTable(row_keys) # type: ignore
-        for row_vals in row_val_list:
-            table.add_row(row_vals)
+        for row in data:
+            table.add_row([row.get(key, None) for key in row_keys])
         table.align = "l"
         print(table, flush=True) # type: ignore
 
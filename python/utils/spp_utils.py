@@ -33,6 +33,7 @@ class SppUtils:
         get_capture_timestamp_sec - Returns Tuple of the capturetimestamp name and value.
         epoch_time_to_seconds - Converts timestamp from any epoch-format into epoch-seconds.
         get_nested_kv - Aquire a nested key-value pair from a dict with possible sub-dicts.
+        get_nested_value - Aquire a nested value from a dict by an already split path.
         parse_unit - Parses a str or number into the lowest unit.
 
     """
@@ -44,6 +45,14 @@ class SppUtils:
     capture_time_key: str = "sppmonCaptureTimestampS"
     """name of the single timestamp capture to allow same naming within the db"""
 
+    # patterns used for each parsed value, compiled once
+    __epoch_int_pattern = re.compile(r"\d+")
+    __epoch_float_pattern = re.compile(r"\d+\.\d+")
+    __value_unit_pattern = re.compile(r"(-?\d+(?:\.\d+)?)([a-zA-Z]+)")
+    __unit_pattern = re.compile(r"(\D+)")
+    __int_value_pattern = re.compile(r"^-?\d+$")
+    __float_value_pattern = re.compile(r"^-?\d+\.\d+$")
+
     @staticmethod
     def filename_of_config(conf_file_path: str, fileending: str) -> str:
         """returns a filepath to the home / sppmonLogs out of the config file + a new fileending
@@ -168,15 +177,21 @@ class SppUtils:
         """
         if(isinstance(time_stamp, str)):
             time_stamp = time_stamp.strip(" ")
-            if(re.match(r"\d+", time_stamp)):
+            if(SppUtils.__epoch_int_pattern.match(time_stamp)):
                 time_stamp = int(time_stamp)
-            elif(re.match(r"\d+\.\d+", time_stamp)):
+            elif(SppUtils.__epoch_float_pattern.match(time_stamp)):
                 time_stamp = float(time_stamp)
         if(not isinstance(time_stamp, (int, float))):
             raise ValueError("unsupported timestamp type")
 
         # convert ms or ns to seconds
         # that is the limit to ms format
+        if(isinstance(time_stamp, int)):
+            # stay within exact integer math, no float conversion required
+            while(time_stamp >= 99999999999):
+                time_stamp //= 1000
+            return int(time_stamp)
+
         while(time_stamp >= 99999999999):
             time_stamp /= 1000
 
@@ -209,10 +224,26 @@ class SppUtils:
         # split into multiple sub-levels
         key_list = key_name.split('.')
 
+        # key is the lowest level, at least one key available due arg check above
+        return (key_list[-1], SppUtils.get_nested_value(key_list=key_list, nested_dict=nested_dict))
+
+    @staticmethod
+    def get_nested_value(key_list: List[str], nested_dict: Dict[str, Any]) -> Optional[Any]:
+        """Aquire a nested value from a dict by an already split path.
+
+        Use this instead of `get_nested_kv` when the same path is looked up in many dicts, split it only once.
+        If the path does not exist returns None.
+
+        Arguments:
+            key_list {List[str]} -- Path to the value wanted, one key per sub-level
+            nested_dict {Dict[str, Any]} -- dictonary with values beeing other dictonarys or the result.
+
+        Returns:
+            Optional[Any] -- the searched result or None if not found
+        """
         sub_dict: Union[Any, Dict[str, Any]] = nested_dict
 
         # go deeper until result is found
-        # at least one key available due arg check above
         for key in key_list:
 
             # path is available -> go on
@@ -223,11 +254,10 @@ class SppUtils:
 
             # path is wrong or not existent
             else:
-                # return wanted key and None
-                return (key_list[-1], None)
+                return None
 
-        # key is now lowest level with right value
-        return (key_list[-1], sub_dict)
+        # lowest level with right value
+        return sub_dict
 
 
     __display_datatype = 1 # Bytes are displayed as bytes
@@ -312,7 +342,7 @@ class SppUtils:
         if(delimiter is None):
             raise ValueError("delimteter cannot be None")
 
-        data_parts = list(map(lambda part: part.strip(" "), data.split(delimiter)))
+        data_parts = [part.strip(" ") for part in data.split(delimiter)]
 
         i: int = 0
         final_value: Union[int, float] = 0
@@ -326,28 +356,30 @@ class SppUtils:
             if(given_unit):
                 unit = given_unit
             else:
-                unit_match = re.match(r"(-?\d+(?:\.\d+)?)([a-zA-Z]+)", value)
+                unit_match = cls.__value_unit_pattern.match(value)
                 if(unit_match):
                     value = unit_match.group(1)
                     if(unit_match.group(2)):
                         unit = unit_match.group(2)
                 elif(i < len(data_parts)):
-                    unit_match = re.match(r"(\D+)", data_parts[i])
+                    unit_match = cls.__unit_pattern.match(data_parts[i])
                     if(unit_match and unit_match.group(1)):
                         unit = unit_match.group(1)
                         i += 1
 
-            if(unit.lower() not in cls.__datatypes):
+            # looked up once, used for the check and the conversion
+            multiplier = cls.__datatypes.get(unit.lower(), None)
+            if(multiplier is None):
                 raise ValueError("no known datatype for value with given unit", value, unit, data_parts)
 
             # convert value
-            if(re.match(r"^-?\d+$", value)):
+            if(cls.__int_value_pattern.match(value)):
                 value = int(value)
-            elif(re.match(r"^-?\d+\.\d+$", value)):
+            elif(cls.__float_value_pattern.match(value)):
                 value = float(value)
             else:
                 raise ValueError("value is not numeric", value)
 
-            final_value += value * cls.__datatypes[unit.lower()]
+            final_value += value * multiplier
 
         return round(final_value)